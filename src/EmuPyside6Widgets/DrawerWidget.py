@@ -12,7 +12,7 @@ from PySide6.QtWidgets import (
     QFrame,
     QGraphicsOpacityEffect,
 )
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QEvent, QRect, Signal
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QEvent, QRect, QTimer, Signal, Slot
 from PySide6.QtGui import QColor, QPalette, QFont, QKeyEvent, QPainter
 from enum import Enum
 
@@ -1094,9 +1094,9 @@ class MainWindow(QMainWindow):
         first_close.clicked.connect(first_drawer._close_drawer)
         
         # Second drawer (smaller, will be on top) - delayed slightly
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(300, lambda: self._show_second_stacked_drawer_sticky())
+        QTimer.singleShot(300, self._show_second_stacked_drawer_sticky)
 
+    @Slot()
     def _show_second_stacked_drawer_sticky(self):
         """Helper to show second stacked sticky drawer"""
         second_widget = QWidget()
@@ -1155,9 +1155,9 @@ class MainWindow(QMainWindow):
         first_close.clicked.connect(first_drawer._close_drawer)
         
         # Second drawer (smaller, will be on top with its own overlay) - delayed slightly
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(300, lambda: self._show_second_stacked_drawer_regular())
+        QTimer.singleShot(300, self._show_second_stacked_drawer_regular)
 
+    @Slot()
     def _show_second_stacked_drawer_regular(self):
         """Helper to show second stacked regular drawer"""
         second_widget = QWidget()
@@ -1202,4 +1202,4 @@ if __name__ == "__main__":
 
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
+    raise SystemExit(app.exec())
@@ -1,4 +1,6 @@
 import sys
+import itertools
+import weakref
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -20,10 +22,24 @@ from PySide6.QtCore import (
     QRect,
     QTimer,
     Signal,
+    Slot,
     QParallelAnimationGroup,
     QPoint,
+    QSize,
+)
+from PySide6.QtGui import (
+    QGuiApplication,
+    QColor,
+    QFont,
+    QPainter,
+    QPalette,
+    QEnterEvent,
+    QIcon,
+    QPixmap,
+    QPen,
+    QStaticText,
+    QTransform,
 )
-from PySide6.QtGui import QColor, QFont, QPainter, QPalette, QEnterEvent
 from enum import Enum
 
 
@@ -114,6 +130,66 @@ SEVERITY_COLORS = {
 }
 
 
+# Frame stylesheets, keyed by (bg, border). The default severities are built at import.
+_frame_stylesheets = {}
+
+
+def _get_frame_stylesheet(bg, border):
+    """Get the NotificationItem frame stylesheet for the given colors"""
+    stylesheet = _frame_stylesheets.get((bg, border))
+    if stylesheet is None:
+        stylesheet = f"""
+            NotificationItem {{
+                background-color: {bg};
+                border: 2px solid {border};
+                border-radius: 8px;
+            }}
+        """
+        _frame_stylesheets[(bg, border)] = stylesheet
+    return stylesheet
+
+
+for _config in SeverityStyle._DEFAULTS.values():
+    _get_frame_stylesheet(_config["bg"], _config["border"])
+del _config
+
+
+# Close button icons, keyed by glyph color. Built lazily since QPixmap needs a QGuiApplication.
+_close_icons = {}
+
+
+def _get_close_icon(color):
+    """Get the close button icon drawn in the given color"""
+    icon = _close_icons.get(color)
+    if icon is None:
+        pixmap = QPixmap(20, 20)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor(color), 2.5, Qt.SolidLine, Qt.RoundCap))
+        painter.drawLine(4, 4, 16, 16)
+        painter.drawLine(16, 4, 4, 16)
+        painter.end()
+        icon = QIcon(pixmap)
+        _close_icons[color] = icon
+    return icon
+
+
+def _system_prefers_reduced_motion():
+    """Check the platform's reduced-motion accessibility setting, where Qt exposes one
+    
+    Needs QStyleHints.accessibility() and QAccessibilityHints.motionPreference(),
+    which only newer Qt 6 releases provide; otherwise motion is assumed to be fine.
+    """
+    hints = QGuiApplication.styleHints()
+    if not hasattr(hints, "accessibility"):
+        return False
+    acc = hints.accessibility()
+    if not (hasattr(acc, "motionPreference") and hasattr(Qt, "MotionPreference")):
+        return False
+    return acc.motionPreference() == Qt.MotionPreference.ReducedMotion
+
+
 class _NotificationManager:
     """Manages notifications per parent and zone for proper stacking"""
     _instances = {}  # parent_id -> {zone: [notifications]}
@@ -151,11 +227,109 @@ class _NotificationManager:
         return -1
 
 
+class _NotificationBody(QWidget):
+    """Title and message text painted directly, used when no custom widget is given"""
+    
+    SPACING = 4
+    
+    # Prepared title layouts keyed by (title, width, font); titles repeat a lot
+    _title_cache = {}
+    _TITLE_CACHE_SIZE = 64
+    
+    # Derived (title, message) fonts keyed by the base font; all bodies share one pair
+    _font_cache = {}
+    
+    def __init__(self, title, message, color, text_width, parent=None):
+        super().__init__(parent)
+        self._color = QColor(color)
+        
+        self._title_font, self._message_font = self._get_fonts(self.font())
+        
+        # Lay the text out once; paintEvent only blits the prepared glyphs
+        self._title_text = self._prepare_title(title, self._title_font, text_width)
+        self._message_text = self._prepare_text(message, self._message_font, text_width)
+        
+        height = 0
+        if self._title_text:
+            height += self._title_text.size().height()
+        if self._message_text:
+            self._message_y = height + self.SPACING if self._title_text else 0
+            height = self._message_y + self._message_text.size().height()
+        
+        self.setAttribute(Qt.WA_TranslucentBackground, True)
+        self.setFixedSize(text_width, int(height + 0.5))
+    
+    @classmethod
+    def _get_fonts(cls, base_font):
+        """Get the title and message fonts derived from a base font"""
+        key = base_font.toString()
+        fonts = cls._font_cache.get(key)
+        if fonts is None:
+            title_font = QFont(base_font)
+            title_font.setPixelSize(13)
+            title_font.setBold(True)
+            message_font = QFont(base_font)
+            message_font.setPixelSize(12)
+            fonts = cls._font_cache[key] = (title_font, message_font)
+        return fonts
+    
+    @staticmethod
+    def _prepare_text(text, font, text_width):
+        """Create a laid-out QStaticText, or None for empty text"""
+        if not text:
+            return None
+        static_text = QStaticText(text)
+        static_text.setTextWidth(text_width)
+        static_text.prepare(QTransform(), font)
+        return static_text
+    
+    @classmethod
+    def _prepare_title(cls, title, font, text_width):
+        """Get a laid-out title, reusing an earlier layout of the same title"""
+        key = (title, text_width, font.toString())
+        static_text = cls._title_cache.get(key)
+        if static_text is None:
+            static_text = cls._prepare_text(title, font, text_width)
+            if len(cls._title_cache) >= cls._TITLE_CACHE_SIZE:
+                cls._title_cache.clear()
+            cls._title_cache[key] = static_text
+        return static_text
+    
+    def paintEvent(self, event):
+        """Draw the prepared title and message"""
+        painter = QPainter(self)
+        painter.setPen(self._color)
+        if self._title_text:
+            painter.setFont(self._title_font)
+            painter.drawStaticText(0, 0, self._title_text)
+        if self._message_text:
+            painter.setFont(self._message_font)
+            painter.drawStaticText(0, self._message_y, self._message_text)
+        painter.end()
+
+
 class NotificationItem(QFrame):
     """Individual notification item"""
     
     closed = Signal(object)  # Emits self when closed
     
+    # Slide/fade animations: None follows the system reduced-motion setting
+    _animate = None
+    
+    _CLOSE_BUTTON_STYLESHEET = """
+        QPushButton {
+            border: none;
+            background: transparent;
+            border-radius: 10px;
+        }
+        QPushButton:hover {
+            background: rgba(255, 255, 255, 0.2);
+        }
+        QPushButton:pressed {
+            background: rgba(255, 255, 255, 0.3);
+        }
+    """
+    
     def __init__(
         self,
         parent,
@@ -217,13 +391,7 @@ class NotificationItem(QFrame):
         # Use instance style for colors
         colors = self._style.to_dict()
         
-        self.setStyleSheet(f"""
-            NotificationItem {{
-                background-color: {colors['bg']};
-                border: 2px solid {colors['border']};
-                border-radius: 8px;
-            }}
-        """)
+        self.setStyleSheet(_get_frame_stylesheet(colors['bg'], colors['border']))
         
         # Set fixed width, height will be determined by content
         self.setFixedWidth(self._width)
@@ -240,54 +408,22 @@ class NotificationItem(QFrame):
         if self._custom_widget:
             # Use custom widget
             content_layout.addWidget(self._custom_widget)
-        else:
-            # Title (if provided)
-            if self._title:
-                title_label = QLabel(self._title)
-                title_label.setStyleSheet(f"""
-                    QLabel {{
-                        color: {colors['text']};
-                        font-weight: bold;
-                        font-size: 13px;
-                        background: transparent;
-                    }}
-                """)
-                title_label.setWordWrap(True)
-                content_layout.addWidget(title_label)
-            
-            # Message
-            if self._message:
-                message_label = QLabel(self._message)
-                message_label.setStyleSheet(f"""
-                    QLabel {{
-                        color: {colors['text']};
-                        font-size: 12px;
-                        background: transparent;
-                    }}
-                """)
-                message_label.setWordWrap(True)
-                content_layout.addWidget(message_label)
+        elif self._title or self._message:
+            # Width left for text after the 2px border, margins, spacing and the close button
+            text_width = self._width - 2 * 2 - 12 - 8 - 8 - 20
+            content_layout.addWidget(
+                _NotificationBody(self._title, self._message, colors['text'], text_width)
+            )
         
         main_layout.addLayout(content_layout, 1)
         
         # Close button
-        self.close_button = QPushButton("✕", self)
+        self.close_button = QPushButton(self)
+        self.close_button.setIcon(_get_close_icon(colors['text']))
+        self.close_button.setIconSize(QSize(10, 10))
+        self.close_button.setFlat(True)
         self.close_button.setFixedSize(20, 20)
-        self.close_button.setStyleSheet(f"""
-            QPushButton {{
-                color: {colors['text']};
-                font-size: 12px;
-                border: none;
-                background: transparent;
-                border-radius: 10px;
-            }}
-            QPushButton:hover {{
-                background: rgba(255, 255, 255, 0.2);
-            }}
-            QPushButton:pressed {{
-                background: rgba(255, 255, 255, 0.3);
-            }}
-        """)
+        self.close_button.setStyleSheet(self._CLOSE_BUTTON_STYLESHEET)
         self.close_button.clicked.connect(self._start_dismiss)
         main_layout.addWidget(self.close_button, 0, Qt.AlignTop)
         
@@ -310,27 +446,31 @@ class NotificationItem(QFrame):
         # Install event filter on parent for resize
         self.parent().installEventFilter(self)
         
-        # Calculate initial position (off-screen)
-        self._update_position(animate=False, off_screen=True)
+        # Calculate the stack slot once; both the off-screen start and the slide use it
+        parent_rect = self.parent().rect()
+        target_pos = self._calculate_target_position(parent_rect)
+        self.move(self._calculate_off_screen_position(parent_rect, target_pos))
         
         # Show widget
         self.show()
         self.raise_()
         
         # Animate in
-        self._animate_in()
+        self._animate_in(target_pos)
         
         # Start auto-dismiss timer if duration > 0
         if self._duration > 0:
             self._dismiss_timer.start(self._duration)
             self._elapsed_timer.start()
     
-    def _calculate_target_position(self):
+    def _calculate_target_position(self, parent_rect=None):
         """Calculate the target position for this notification"""
         if not self.parent():
             return QPoint(0, 0)
         
-        parent_rect = self.parent().rect()
+        # Callers repositioning a whole stack pass the rect in so it is fetched once
+        if parent_rect is None:
+            parent_rect = self.parent().rect()
         margin = 15
         spacing = 10
         
@@ -364,13 +504,15 @@ class NotificationItem(QFrame):
         
         return QPoint(x, y)
     
-    def _calculate_off_screen_position(self):
+    def _calculate_off_screen_position(self, parent_rect=None, target=None):
         """Calculate off-screen position for slide animation"""
         if not self.parent():
             return QPoint(0, 0)
         
-        parent_rect = self.parent().rect()
-        target = self._calculate_target_position()
+        if parent_rect is None:
+            parent_rect = self.parent().rect()
+        if target is None:
+            target = self._calculate_target_position(parent_rect)
         
         # Slide direction based on zone (left zones slide left, right zones slide right)
         if self._zone in [NotificationZone.TOP_RIGHT, NotificationZone.BOTTOM_RIGHT]:
@@ -378,19 +520,32 @@ class NotificationItem(QFrame):
         else:
             return QPoint(-self._width - 10, target.y())
     
-    def _update_position(self, animate=True, off_screen=False):
+    def _update_position(self, animate=True, off_screen=False, parent_rect=None):
         """Update position, optionally with animation"""
         if off_screen:
-            pos = self._calculate_off_screen_position()
+            pos = self._calculate_off_screen_position(parent_rect)
             self.move(pos)
         elif animate:
-            self._animate_to_position(self._calculate_target_position())
+            self._animate_to_position(self._calculate_target_position(parent_rect))
         else:
-            self.move(self._calculate_target_position())
+            self.move(self._calculate_target_position(parent_rect))
     
-    def _animate_in(self):
+    @classmethod
+    def _animations_enabled(cls):
+        """Whether show/dismiss/restack transitions should be animated"""
+        if cls._animate is None:
+            return not _system_prefers_reduced_motion()
+        return cls._animate
+    
+    def _animate_in(self, target_pos=None):
         """Animate notification sliding in"""
-        target_pos = self._calculate_target_position()
+        if target_pos is None:
+            target_pos = self._calculate_target_position()
+        
+        if not self._animations_enabled():
+            self.move(target_pos)
+            self.opacity_effect.setOpacity(1)
+            return
         
         # Slide animation
         self._slide_animation = QPropertyAnimation(self, b"pos")
@@ -414,6 +569,10 @@ class NotificationItem(QFrame):
         if self._position_animation and self._position_animation.state() == QPropertyAnimation.Running:
             self._position_animation.stop()
         
+        if not self._animations_enabled():
+            self.move(target_pos)
+            return
+        
         self._position_animation = QPropertyAnimation(self, b"pos")
         self._position_animation.setDuration(250)
         self._position_animation.setStartValue(self.pos())
@@ -421,6 +580,7 @@ class NotificationItem(QFrame):
         self._position_animation.setEasingCurve(QEasingCurve.OutCubic)
         self._position_animation.start()
     
+    @Slot()
     def _start_dismiss(self):
         """Start the dismiss animation"""
         if self._closing:
@@ -431,6 +591,10 @@ class NotificationItem(QFrame):
         self._dismiss_timer.stop()
         self._elapsed_timer.stop()
         
+        if not self._animations_enabled():
+            self._cleanup()
+            return
+        
         # Calculate off-screen position
         off_screen_pos = self._calculate_off_screen_position()
         
@@ -471,10 +635,11 @@ class NotificationItem(QFrame):
         if not self.parent():
             return
         
+        parent_rect = self.parent().rect()
         notifications = _NotificationManager.get_notifications(self.parent(), self._zone)
         for notif in notifications:
             if notif != self and not notif._closing:
-                notif._update_position(animate=True)
+                notif._update_position(animate=True, parent_rect=parent_rect)
     
     def _tick(self):
         """Called periodically to track elapsed time"""
@@ -505,7 +670,8 @@ class NotificationItem(QFrame):
         """Handle parent resize"""
         if obj == self.parent() and event.type() == QEvent.Resize:
             if not self._closing:
-                self._update_position(animate=True)
+                # The resize event already carries the new size, no need to query the parent
+                self._update_position(animate=True, parent_rect=QRect(QPoint(0, 0), event.size()))
         return super().eventFilter(obj, event)
 
 
@@ -589,6 +755,23 @@ class NotificationManager(QWidget):
         else:
             self._styles[severity] = SeverityStyle.default(severity)
     
+    @property
+    def animations_enabled(self):
+        """Whether notifications are currently animated"""
+        return NotificationItem._animations_enabled()
+    
+    def set_animations_enabled(self, enabled):
+        """
+        Enable or disable notification animations.
+        
+        This applies to all notifications, not only the ones from this manager.
+        
+        Args:
+            enabled: True/False to force animations on/off, or None to follow the
+                     system reduced-motion setting (the default)
+        """
+        NotificationItem._animate = enabled
+    
     def show_notification(
         self,
         message="",
@@ -639,6 +822,32 @@ class NotificationManager(QWidget):
         
         return notification
     
+    def show_notifications(self, specs):
+        """
+        Show several notifications at once.
+        
+        Parent repaints are held off until every notification has been created,
+        so the batch lands in a single update instead of one per notification.
+        
+        Args:
+            specs: Iterable of dicts of show_notification() keyword arguments
+        
+        Returns:
+            List of the NotificationItem instances
+        
+        Usage:
+            manager.show_notifications([
+                {"message": "Saved", "severity": NotificationSeverity.SUCCESS},
+                {"message": "Synced", "zone": NotificationZone.BOTTOM_RIGHT},
+            ])
+        """
+        parent = self.parent()
+        parent.setUpdatesEnabled(False)
+        try:
+            return [self.show_notification(**spec) for spec in specs]
+        finally:
+            parent.setUpdatesEnabled(True)
+    
     def _on_notification_closed(self, notification):
         """Handle notification closed"""
         if notification in self._notifications:
@@ -653,44 +862,122 @@ class NotificationManager(QWidget):
 
 
 # Convenience functions for quick notifications
+_default_managers = weakref.WeakKeyDictionary()  # parent -> NotificationManager
+
+
+def _get_default_manager(parent):
+    """Get the shared NotificationManager used by the convenience functions for a parent"""
+    manager = _default_managers.get(parent)
+    if manager is None:
+        manager = NotificationManager(parent)
+        _default_managers[parent] = manager
+    return manager
+
+
 def show_info(parent, message, title="", zone=NotificationZone.TOP_RIGHT, duration=None):
     """Show an info notification"""
-    notif = NotificationItem(parent, message, title, NotificationSeverity.INFO, zone, duration)
-    notif.show_notification()
-    return notif
+    return _get_default_manager(parent).show_notification(
+        message=message, title=title, severity=NotificationSeverity.INFO, zone=zone, duration=duration
+    )
 
 
 def show_success(parent, message, title="", zone=NotificationZone.TOP_RIGHT, duration=None):
     """Show a success notification"""
-    notif = NotificationItem(parent, message, title, NotificationSeverity.SUCCESS, zone, duration)
-    notif.show_notification()
-    return notif
+    return _get_default_manager(parent).show_notification(
+        message=message, title=title, severity=NotificationSeverity.SUCCESS, zone=zone, duration=duration
+    )
 
 
 def show_warning(parent, message, title="", zone=NotificationZone.TOP_RIGHT, duration=None):
     """Show a warning notification"""
-    notif = NotificationItem(parent, message, title, NotificationSeverity.WARNING, zone, duration)
-    notif.show_notification()
-    return notif
+    return _get_default_manager(parent).show_notification(
+        message=message, title=title, severity=NotificationSeverity.WARNING, zone=zone, duration=duration
+    )
 
 
 def show_error(parent, message, title="", zone=NotificationZone.TOP_RIGHT, duration=None):
     """Show an error notification"""
-    notif = NotificationItem(parent, message, title, NotificationSeverity.ERROR, zone, duration)
-    notif.show_notification()
-    return notif
+    return _get_default_manager(parent).show_notification(
+        message=message, title=title, severity=NotificationSeverity.ERROR, zone=zone, duration=duration
+    )
 
 
 def show_critical(parent, message, title="", zone=NotificationZone.TOP_RIGHT):
     """Show a critical notification (no auto-dismiss)"""
-    notif = NotificationItem(parent, message, title, NotificationSeverity.CRITICAL, zone, 0)
-    notif.show_notification()
-    return notif
+    return _get_default_manager(parent).show_notification(
+        message=message, title=title, severity=NotificationSeverity.CRITICAL, zone=zone, duration=0
+    )
 
 
 # ============== Demo Application ==============
 
+# Shared by every demo button; parsed once on the window instead of per button.
+# Variants are selected with the "variant" dynamic property.
+_DEMO_BUTTON_QSS = """
+    QPushButton#demoBtn {
+        padding: 10px 20px;
+        font-size: 14px;
+        margin: 5px;
+        border-radius: 6px;
+        background: #007ACC;
+        color: white;
+        border: none;
+    }
+    QPushButton#demoBtn:hover {
+        background: #005A9F;
+    }
+    QPushButton#demoBtn:pressed {
+        background: #004080;
+    }
+    QPushButton#demoBtn[variant="danger"] {
+        background: #dc3545;
+    }
+    QPushButton#demoBtn[variant="danger"]:hover {
+        background: #c82333;
+    }
+    QPushButton#demoBtn[variant="danger"]:pressed {
+        background: #bd2130;
+    }
+    QPushButton[variant="accept"], QPushButton[variant="decline"] {
+        color: white;
+        border: 1px solid rgba(255,255,255,0.3);
+        padding: 5px 15px;
+        border-radius: 4px;
+    }
+    QPushButton[variant="accept"] {
+        background: rgba(255,255,255,0.2);
+    }
+    QPushButton[variant="accept"]:hover {
+        background: rgba(255,255,255,0.3);
+    }
+    QPushButton[variant="decline"] {
+        background: transparent;
+    }
+    QPushButton[variant="decline"]:hover {
+        background: rgba(255,255,255,0.1);
+    }
+"""
+
+
 class MainWindow(QMainWindow):
+    _DEMO_TITLES = {
+        NotificationSeverity.INFO: "Information",
+        NotificationSeverity.SUCCESS: "Success!",
+        NotificationSeverity.WARNING: "Warning",
+        NotificationSeverity.ERROR: "Error",
+        NotificationSeverity.CRITICAL: "Critical Alert",
+    }
+    
+    _DEMO_MESSAGES = {
+        NotificationSeverity.INFO: "This is an info notification #{}",
+        NotificationSeverity.SUCCESS: "Operation completed successfully #{}",
+        NotificationSeverity.WARNING: "Please review this warning #{}",
+        NotificationSeverity.ERROR: "An error has occurred #{}",
+        NotificationSeverity.CRITICAL: "Critical issue requires attention #{}",
+    }
+    
+    _ZONE_TITLES = {zone: zone.value.replace("_", " ").title() for zone in NotificationZone}
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Notification Widget Demo")
@@ -699,8 +986,17 @@ class MainWindow(QMainWindow):
         # Create notification manager
         self.notification_mgr = NotificationManager(self)
         
-        # Track notification count for demo
-        self._notification_count = 0
+        # Numbers the demo notifications
+        self._notification_counter = itertools.count(1)
+        
+        # Steps of the stacking demos, played back one per timer tick
+        self._sequence_steps = []
+        self._sequence_timer = QTimer(self)
+        self._sequence_timer.setInterval(200)
+        self._sequence_timer.timeout.connect(self._advance_sequence)
+        
+        # Custom notification widgets handed back by closed notifications
+        self._custom_widget_pool = []
 
         # Create main content
         central_widget = QWidget()
@@ -798,23 +1094,8 @@ class MainWindow(QMainWindow):
         
         btn_close_all = QPushButton("Close All")
         btn_close_all.clicked.connect(lambda: self.notification_mgr.close_all())
-        btn_close_all.setStyleSheet("""
-            QPushButton {
-                padding: 10px 20px;
-                font-size: 14px;
-                margin: 5px;
-                border-radius: 6px;
-                background: #dc3545;
-                color: white;
-                border: none;
-            }
-            QPushButton:hover {
-                background: #c82333;
-            }
-            QPushButton:pressed {
-                background: #bd2130;
-            }
-        """)
+        btn_close_all.setObjectName("demoBtn")
+        btn_close_all.setProperty("variant", "danger")
         
         btn_custom = QPushButton("Custom Widget Notification")
         btn_custom.clicked.connect(self.show_custom_widget_notification)
@@ -851,66 +1132,30 @@ class MainWindow(QMainWindow):
             btn_top_left, btn_top_right, btn_bottom_left, btn_bottom_right,
             btn_stack_3, btn_stack_mixed, btn_all_corners, btn_custom,
         ]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    padding: 10px 20px;
-                    font-size: 14px;
-                    margin: 5px;
-                    border-radius: 6px;
-                    background: #007ACC;
-                    color: white;
-                    border: none;
-                }
-                QPushButton:hover {
-                    background: #005A9F;
-                }
-                QPushButton:pressed {
-                    background: #004080;
-                }
-            """)
+            btn.setObjectName("demoBtn")
+        self.setStyleSheet(_DEMO_BUTTON_QSS)
     
     def show_demo_notification(self, severity):
         """Show a demo notification with given severity"""
-        self._notification_count += 1
-        
-        titles = {
-            NotificationSeverity.INFO: "Information",
-            NotificationSeverity.SUCCESS: "Success!",
-            NotificationSeverity.WARNING: "Warning",
-            NotificationSeverity.ERROR: "Error",
-            NotificationSeverity.CRITICAL: "Critical Alert",
-        }
-        
-        messages = {
-            NotificationSeverity.INFO: f"This is an info notification #{self._notification_count}",
-            NotificationSeverity.SUCCESS: f"Operation completed successfully #{self._notification_count}",
-            NotificationSeverity.WARNING: f"Please review this warning #{self._notification_count}",
-            NotificationSeverity.ERROR: f"An error has occurred #{self._notification_count}",
-            NotificationSeverity.CRITICAL: f"Critical issue requires attention #{self._notification_count}",
-        }
-        
         self.notification_mgr.show_notification(
-            message=messages[severity],
-            title=titles[severity],
+            message=self._DEMO_MESSAGES[severity].format(next(self._notification_counter)),
+            title=self._DEMO_TITLES[severity],
             severity=severity,
             zone=NotificationZone.TOP_RIGHT,
         )
     
     def show_zone_notification(self, zone):
         """Show a notification in the specified zone"""
-        self._notification_count += 1
         self.notification_mgr.show_notification(
-            message=f"Notification in {zone.value} zone #{self._notification_count}",
-            title=f"{zone.value.replace('_', ' ').title()}",
+            message=f"Notification in {zone.value} zone #{next(self._notification_counter)}",
+            title=self._ZONE_TITLES[zone],
             severity=NotificationSeverity.INFO,
             zone=zone,
         )
     
+    @Slot()
     def show_stacked_notifications(self):
         """Show multiple notifications to demonstrate stacking"""
-        from PySide6.QtCore import QTimer
-        
-        self._notification_count += 1
         self.notification_mgr.show_notification(
             message="First notification - will disappear first",
             title="Notification 1",
@@ -918,11 +1163,23 @@ class MainWindow(QMainWindow):
             zone=NotificationZone.TOP_RIGHT,
         )
         
-        QTimer.singleShot(200, lambda: self._show_stacked_2())
-        QTimer.singleShot(400, lambda: self._show_stacked_3())
+        self._queue_sequence([self._show_stacked_2, self._show_stacked_3])
+    
+    def _queue_sequence(self, steps):
+        """Queue demo steps to run one every 200ms"""
+        self._sequence_steps.extend(steps)
+        if not self._sequence_timer.isActive():
+            self._sequence_timer.start()
+    
+    @Slot()
+    def _advance_sequence(self):
+        """Run the next queued demo step"""
+        if self._sequence_steps:
+            self._sequence_steps.pop(0)()
+        if not self._sequence_steps:
+            self._sequence_timer.stop()
     
     def _show_stacked_2(self):
-        self._notification_count += 1
         self.notification_mgr.show_notification(
             message="Second notification - watch the animation!",
             title="Notification 2",
@@ -931,7 +1188,6 @@ class MainWindow(QMainWindow):
         )
     
     def _show_stacked_3(self):
-        self._notification_count += 1
         self.notification_mgr.show_notification(
             message="Third notification - when one closes, others slide into place",
             title="Notification 3",
@@ -939,6 +1195,7 @@ class MainWindow(QMainWindow):
             zone=NotificationZone.TOP_RIGHT,
         )
     
+    @Slot()
     def show_mixed_stack(self):
         """Show mixed severity stack to demonstrate hover pause"""
         self.notification_mgr.show_notification(
@@ -949,36 +1206,62 @@ class MainWindow(QMainWindow):
             duration=10000,  # 10 seconds
         )
         
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(200, lambda: self.notification_mgr.show_notification(
+        self._queue_sequence([self._show_mixed_quick_info, self._show_mixed_critical])
+    
+    def _show_mixed_quick_info(self):
+        self.notification_mgr.show_notification(
             message="I'll dismiss in 3 seconds unless you hover!",
             title="Quick Info",
             severity=NotificationSeverity.SUCCESS,
             zone=NotificationZone.TOP_RIGHT,
-        ))
-        
-        QTimer.singleShot(400, lambda: self.notification_mgr.show_notification(
+        )
+    
+    def _show_mixed_critical(self):
+        self.notification_mgr.show_notification(
             message="I won't auto-dismiss. Close me manually!",
             title="Critical",
             severity=NotificationSeverity.CRITICAL,
             zone=NotificationZone.TOP_RIGHT,
-        ))
+        )
     
+    @Slot()
     def show_all_corners(self):
         """Show notifications in all corners"""
-        self._notification_count += 1
-        
-        for zone in NotificationZone:
-            self.notification_mgr.show_notification(
-                message=f"Notification #{self._notification_count}",
-                title=zone.value.replace("_", " ").title(),
-                severity=NotificationSeverity.INFO,
-                zone=zone,
-            )
+        # One shared number for the whole batch
+        number = next(self._notification_counter)
+        self.notification_mgr.show_notifications([
+            {
+                "message": f"Notification #{number}",
+                "title": self._ZONE_TITLES[zone],
+                "severity": NotificationSeverity.INFO,
+                "zone": zone,
+            }
+            for zone in NotificationZone
+        ])
     
+    @Slot()
     def show_custom_widget_notification(self):
         """Show a notification with a custom widget"""
-        # Create custom widget
+        # Reuse a custom widget released by a closed notification if there is one
+        if self._custom_widget_pool:
+            custom = self._custom_widget_pool.pop()
+        else:
+            custom = self._build_custom_widget()
+        
+        notif = self.notification_mgr.show_notification(
+            severity=NotificationSeverity.WARNING,
+            zone=NotificationZone.TOP_RIGHT,
+            duration=0,  # Don't auto-dismiss
+            custom_widget=custom,
+        )
+        
+        # Connect buttons to close
+        custom.btn_yes.clicked.connect(notif._start_dismiss)
+        custom.btn_no.clicked.connect(notif._start_dismiss)
+        notif.closed.connect(self._release_custom_widget)
+    
+    def _build_custom_widget(self):
+        """Build the content widget for the custom widget notification"""
         custom = QWidget()
         custom_layout = QVBoxLayout(custom)
         custom_layout.setContentsMargins(0, 0, 0, 0)
@@ -988,51 +1271,26 @@ class MainWindow(QMainWindow):
         
         btn_layout = QHBoxLayout()
         
-        btn_yes = QPushButton("Accept")
-        btn_yes.setStyleSheet("""
-            QPushButton {
-                background: rgba(255,255,255,0.2);
-                color: white;
-                border: 1px solid rgba(255,255,255,0.3);
-                padding: 5px 15px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background: rgba(255,255,255,0.3);
-            }
-        """)
+        custom.btn_yes = QPushButton("Accept")
+        custom.btn_yes.setProperty("variant", "accept")
         
-        btn_no = QPushButton("Decline")
-        btn_no.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: white;
-                border: 1px solid rgba(255,255,255,0.3);
-                padding: 5px 15px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background: rgba(255,255,255,0.1);
-            }
-        """)
+        custom.btn_no = QPushButton("Decline")
+        custom.btn_no.setProperty("variant", "decline")
         
-        btn_layout.addWidget(btn_yes)
-        btn_layout.addWidget(btn_no)
+        btn_layout.addWidget(custom.btn_yes)
+        btn_layout.addWidget(custom.btn_no)
         
         custom_layout.addWidget(label)
         custom_layout.addLayout(btn_layout)
-        
-        notif = self.notification_mgr.show_notification(
-            severity=NotificationSeverity.WARNING,
-            zone=NotificationZone.TOP_RIGHT,
-            duration=0,  # Don't auto-dismiss
-            custom_widget=custom,
-        )
-        
-        # Connect buttons to close
-        btn_yes.clicked.connect(notif._start_dismiss)
-        btn_no.clicked.connect(notif._start_dismiss)
-
+        return custom
+    
+    def _release_custom_widget(self, notification):
+        """Take the custom widget back from a closing notification so it outlives it"""
+        custom = notification._custom_widget
+        custom.btn_yes.clicked.disconnect(notification._start_dismiss)
+        custom.btn_no.clicked.disconnect(notification._start_dismiss)
+        custom.setParent(None)
+        self._custom_widget_pool.append(custom)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -1045,5 +1303,5 @@ if __name__ == "__main__":
 
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
+    raise SystemExit(app.exec())
 
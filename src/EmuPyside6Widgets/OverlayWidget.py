@@ -1,4 +1,4 @@
-import sys
+from functools import partial
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -8,51 +8,69 @@ from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
     QLineEdit,
-    QTextEdit,
-    QGraphicsOpacityEffect,
-    QFrame,
 )
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QEvent, Signal
-from PySide6.QtGui import QColor, QFont, QKeyEvent, QPainter, QPalette
+from PySide6.QtCore import Qt, QObject, QVariantAnimation, QEasingCurve, QEvent, QTimer, Signal
+from PySide6.QtGui import QColor, QPainter, QPalette
+
+
+# Background dimming color for standard (non-nobackground) overlays
+_DIM_COLOR = QColor(0, 0, 0, 120)
 
 
 # Internal tracker for overlay z-ordering
 class _OverlayTracker:
-    """Internal tracker for overlay z-ordering"""
-    _instances = {}  # parent_id -> [overlays]
-    _z_counter = {}  # parent_id -> counter
+    """Internal tracker for overlay z-ordering
+
+    The stack lives on the parent itself as ``_overlay_stack`` ({overlay: None}, a dict
+    used as an ordered set, bottom to top), so it is released together with the parent.
+    """
     
     @classmethod
     def register(cls, parent, overlay):
         """Register an overlay and get its z-index"""
-        parent_id = id(parent)
-        if parent_id not in cls._instances:
-            cls._instances[parent_id] = []
-            cls._z_counter[parent_id] = 0
-        
-        cls._instances[parent_id].append(overlay)
-        cls._z_counter[parent_id] += 1
-        return cls._z_counter[parent_id]
+        stack = getattr(parent, "_overlay_stack", None)
+        if stack is None:
+            stack = parent._overlay_stack = {}
+            parent._overlay_z_counter = 0
+        
+        stack[overlay] = None
+        parent._overlay_z_counter += 1
+        return parent._overlay_z_counter
     
     @classmethod
     def unregister(cls, parent, overlay):
         """Remove an overlay from tracking"""
-        parent_id = id(parent)
-        if parent_id in cls._instances:
-            if overlay in cls._instances[parent_id]:
-                cls._instances[parent_id].remove(overlay)
+        stack = getattr(parent, "_overlay_stack", None)
+        if stack is not None:
+            stack.pop(overlay, None)
     
     @classmethod
     def get_overlays(cls, parent):
         """Get all overlays for a parent"""
-        parent_id = id(parent)
-        return cls._instances.get(parent_id, [])
+        return list(getattr(parent, "_overlay_stack", ()))
     
     @classmethod
     def is_topmost(cls, parent, overlay):
         """Check if this overlay is the topmost"""
-        overlays = cls.get_overlays(parent)
-        return len(overlays) == 0 or overlays[-1] == overlay
+        stack = getattr(parent, "_overlay_stack", None)
+        return not stack or next(reversed(stack)) == overlay
+
+
+class _ParentResizeFilter(QObject):
+    """Event filter that forwards only parent and content resizes to its overlay"""
+    
+    def __init__(self, overlay):
+        super().__init__(overlay)
+        self._overlay = overlay
+    
+    def eventFilter(self, source, event):
+        if event.type() == QEvent.Resize:
+            # A resized content widget keeps its position, so its hit-test bounds can
+            # be refreshed now; re-centering waits for the scheduled reposition
+            if source is self._overlay._content_widget:
+                self._overlay._update_hit_bounds()
+            self._overlay._schedule_reposition()
+        return False
 
 
 class OverlayManager:
@@ -70,6 +88,8 @@ class OverlayManager:
                 self.overlay_manager.show_overlay(widget, sticky=True)
     """
     
+    __slots__ = ("_parent", "_overlays", "_nobackground_overlays")
+    
     def __init__(self, parent):
         """
         Initialize the overlay manager.
@@ -78,7 +98,8 @@ class OverlayManager:
             parent: The parent widget where overlays will be shown
         """
         self._parent = parent
-        self._overlays = []
+        self._overlays = []  # All open overlays, in opening order
+        self._nobackground_overlays = []  # Subset of _overlays, kept for filtered closes
     
     def show_overlay(self, widget, sticky=False, nobackground=False):
         """
@@ -96,7 +117,10 @@ class OverlayManager:
         overlay.show_widget(widget)
         
         self._overlays.append(overlay)
-        overlay.closed.connect(lambda: self._on_overlay_closed(overlay))
+        if nobackground:
+            self._nobackground_overlays.append(overlay)
+        # The manager is not a QObject, so it cannot use sender(); bind the overlay instead
+        overlay.closed.connect(partial(self._on_overlay_closed, overlay))
         
         return overlay
     
@@ -104,6 +128,8 @@ class OverlayManager:
         """Handle overlay closed"""
         if overlay in self._overlays:
             self._overlays.remove(overlay)
+        if overlay in self._nobackground_overlays:
+            self._nobackground_overlays.remove(overlay)
     
     def close_all(self, nobackground_only=False):
         """
@@ -112,10 +138,8 @@ class OverlayManager:
         Args:
             nobackground_only: Only close nobackground overlays
         """
-        overlays_to_close = self._overlays.copy()
-        for overlay in overlays_to_close:
-            if nobackground_only and not overlay._nobackground:
-                continue
+        source = self._nobackground_overlays if nobackground_only else self._overlays
+        for overlay in source.copy():
             overlay._close_overlay()
     
     def get_open_overlays(self):
@@ -146,6 +170,30 @@ class OverlayWidget(QWidget):
     
     closed = Signal()  # Emitted when overlay is closed
     
+    # Default content background from the application palette, rebuilt after palette changes
+    _bg_stylesheet = None
+    _bg_stylesheet_app = None  # Application whose paletteChanged invalidates the cache
+    
+    _CLOSE_BUTTON_STYLESHEET = """
+        QPushButton {
+            color: white;
+            font-size: 16px;
+            border: none;
+            background: rgba(60, 60, 60, 200);
+            border-radius: 12px;
+            min-width: 24px;
+            max-width: 24px;
+            min-height: 24px;
+            max-height: 24px;
+        }
+        QPushButton:hover {
+            background: rgba(80, 80, 80, 220);
+        }
+        QPushButton:pressed {
+            background: rgba(100, 100, 100, 240);
+        }
+    """
+    
     def __init__(self, parent=None, sticky=False, nobackground=False):
         super().__init__(parent)
         self._sticky = sticky
@@ -153,21 +201,24 @@ class OverlayWidget(QWidget):
         self._z_index = 0
         self.setup_ui()
         self._content_widget = None
-        self._animation = None
+        self._fade = 0.0  # Dim background strength, animated 0 -> 1 on open
         self._closing = False  # Prevent multiple closes
+        # Hit-test bounds as (x0, y0, x1, y1), refreshed whenever children are positioned
+        # or the content widget resizes
+        self._content_bounds = (0, 0, 0, 0)
+        self._close_bounds = (0, 0, 0, 0)
 
         # Enable key events and make sure we get focus
         self.setFocusPolicy(Qt.StrongFocus)
 
-        # Track parent resize events if parent exists
-        if parent:
-            parent.installEventFilter(self)
-
-    def eventFilter(self, source, event):
-        """Handle parent resize events"""
-        if source == self.parent() and event.type() == QEvent.Resize:
-            self._position_content()
-        return super().eventFilter(source, event)
+        # Tracks parent resizes, installed only while the overlay is shown
+        self._resize_filter = _ParentResizeFilter(self)
+        
+        # Resize bursts are coalesced into one reposition once pending events drain
+        self._reposition_timer = QTimer(self)
+        self._reposition_timer.setSingleShot(True)
+        self._reposition_timer.setInterval(0)
+        self._reposition_timer.timeout.connect(self._position_content)
 
     def setup_ui(self):
         # For nobackground mode, we don't cover the whole parent initially
@@ -177,38 +228,31 @@ class OverlayWidget(QWidget):
 
         # Set window flags and attributes for proper overlay behavior
         self.setAttribute(Qt.WA_TranslucentBackground, False)
+        if not self._nobackground:
+            # paintEvent covers the dirty area itself, so Qt need not erase it first
+            self.setAttribute(Qt.WA_NoSystemBackground, True)
 
-        # Create opacity effect for the entire overlay
-        self.opacity_effect = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self.opacity_effect)
-        self.opacity_effect.setOpacity(0)
+        # Close button - created on first show, positioned based on mode
+        self.close_button = None
 
-        # Close button - will be positioned based on mode
-        self.close_button = QPushButton("✕", self)
-        self.close_button.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-size: 16px;
-                border: none;
-                background: rgba(60, 60, 60, 200);
-                border-radius: 12px;
-                min-width: 24px;
-                max-width: 24px;
-                min-height: 24px;
-                max-height: 24px;
-            }
-            QPushButton:hover {
-                background: rgba(80, 80, 80, 220);
-            }
-            QPushButton:pressed {
-                background: rgba(100, 100, 100, 240);
-            }
-        """)
-        self.close_button.clicked.connect(self._close_overlay)
+        # Fade animation, reconfigured for each open and close. Nobackground
+        # overlays paint no dim layer, so they have nothing to fade.
+        self._animation = None
+        if not self._nobackground:
+            self._animation = QVariantAnimation(self)
+            self._animation.valueChanged.connect(self._set_fade)
+            self._animation.finished.connect(self._on_animation_finished)
 
         # Initially hidden
         self.hide()
 
+    def _ensure_close_button(self):
+        """Create the close button the first time the overlay is shown"""
+        if self.close_button is None:
+            self.close_button = QPushButton("✕", self)
+            self.close_button.setStyleSheet(self._CLOSE_BUTTON_STYLESHEET)
+            self.close_button.clicked.connect(self._close_overlay)
+
     def paintEvent(self, event):
         """Custom paint event to draw the dimmed background"""
         # Skip dark overlay for nobackground mode
@@ -217,10 +261,12 @@ class OverlayWidget(QWidget):
             return
             
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setOpacity(self._fade)
 
-        # Fill the entire overlay with semi-transparent dark color
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 120))
+        # Fill the dirty area with semi-transparent dark color, scaled by the fade.
+        # The color is uniform, so partial updates need not refill the whole overlay.
+        painter.fillRect(event.rect(), _DIM_COLOR)
+        painter.end()
 
         super().paintEvent(event)
 
@@ -232,39 +278,73 @@ class OverlayWidget(QWidget):
         
         # Clear previous content
         if self._content_widget:
+            self._content_widget.removeEventFilter(self._resize_filter)
             self._content_widget.setParent(None)
             self._content_widget.deleteLater()
 
         # Store and add new widget directly to overlay
         self._content_widget = widget
         self._content_widget.setParent(self)
+        self._content_widget.installEventFilter(self._resize_filter)
 
-        # Ensure widget gets proper system background color if it doesn't have one set
-        if not widget.styleSheet() or "background" not in widget.styleSheet():
-            # Get the system default window background color
-            palette = QApplication.palette()
-            bg_color = palette.color(QPalette.Window)
-            widget.setStyleSheet(f"QWidget {{ background-color: {bg_color.name()}; }}")
+        # Ensure widget gets proper system background color if it doesn't have one set.
+        # The stylesheet is fetched once; an empty one contains no "background" either.
+        if "background" not in widget.styleSheet():
+            widget.setStyleSheet(self._default_bg_stylesheet())
 
         self._content_widget.raise_()  # Ensure it's above the dimmed background
+        # Neither child is reparented after this, so the z-order only needs setting once
+        self._ensure_close_button()
+        self.close_button.raise_()
 
-        # Position elements before showing
+        # Position elements before showing, and follow parent resizes from now on
         self._position_content()
+        if self.parent():
+            self.parent().installEventFilter(self._resize_filter)
 
-        # Show and animate
+        # Show and animate. Raising and focusing wait until the show event has been
+        # processed; activateWindow() is not needed since the overlay is a child widget.
         self.show()
-        self.raise_()
-        self.activateWindow()
-        self.setFocus()
+        QTimer.singleShot(0, self._on_shown)
+        if self._animation is None:
+            return
 
-        # Start fade-in animation
-        self.opacity_effect.setOpacity(0)
-        self._animation = QPropertyAnimation(self.opacity_effect, b"opacity")
+        # Fade the dim background in. Animating the fill alpha keeps the overlay on
+        # Qt's normal paint path; an opacity effect would render it offscreen every frame.
+        self._fade = 0.0
+        self._animation.stop()
         self._animation.setDuration(250)
-        self._animation.setStartValue(0)
-        self._animation.setEndValue(1)
+        self._animation.setStartValue(0.0)
+        self._animation.setEndValue(1.0)
         self._animation.setEasingCurve(QEasingCurve.OutCubic)
         self._animation.start()
+    
+    def _on_shown(self):
+        """Bring the freshly shown overlay to the front and give it keyboard focus"""
+        self.raise_()
+        self.setFocus()
+    
+    def _set_fade(self, value):
+        """Apply an animation step to the dim background"""
+        self._fade = value
+        self.update()
+
+    @classmethod
+    def _default_bg_stylesheet(cls):
+        """Get the stylesheet giving content the system window background color"""
+        if cls._bg_stylesheet is None:
+            app = QApplication.instance()
+            if cls._bg_stylesheet_app is not app:
+                app.paletteChanged.connect(cls._invalidate_bg_stylesheet)
+                cls._bg_stylesheet_app = app
+            bg_color = QApplication.palette().color(QPalette.Window)
+            cls._bg_stylesheet = f"QWidget {{ background-color: {bg_color.name()}; }}"
+        return cls._bg_stylesheet
+
+    @classmethod
+    def _invalidate_bg_stylesheet(cls, *args):
+        """Drop the cached background stylesheet after an application palette change"""
+        cls._bg_stylesheet = None
 
     def keyPressEvent(self, event):
         """Close overlay when ESC is pressed"""
@@ -274,6 +354,10 @@ class OverlayWidget(QWidget):
         else:
             super().keyPressEvent(event)
 
+    def _schedule_reposition(self):
+        """Reposition on the next event loop pass, merging repeated requests"""
+        self._reposition_timer.start()
+
     def _position_content(self):
         """Position the content widget and close button"""
         if not self.parent():
@@ -308,10 +392,11 @@ class OverlayWidget(QWidget):
                 self._content_widget.move(padding, padding)
                 
                 # Position close button at top-right of content
-                self.close_button.move(
-                    content_width + padding - 5,
-                    padding - self.close_button.height() + 5
-                )
+                if self.close_button:
+                    self.close_button.move(
+                        content_width + padding - 5,
+                        padding - self.close_button.height() + 5
+                    )
         else:
             # Standard mode: overlay covers whole parent
             self.setGeometry(parent_rect)
@@ -324,9 +409,23 @@ class OverlayWidget(QWidget):
                 )
 
             # Position close button in top-right with margin
-            self.close_button.move(self.width() - self.close_button.width() - 20, 20)
-        
-        self.close_button.raise_()
+            if self.close_button:
+                self.close_button.move(self.width() - self.close_button.width() - 20, 20)
+
+        self._update_hit_bounds()
+
+    def _update_hit_bounds(self):
+        """Refresh the content and close button bounds used by outside-click detection"""
+        self._content_bounds = self._widget_bounds(self._content_widget)
+        self._close_bounds = self._widget_bounds(self.close_button)
+
+    @staticmethod
+    def _widget_bounds(widget):
+        """Return a child's geometry as plain (x0, y0, x1, y1) ints"""
+        if not widget:
+            return (0, 0, 0, 0)
+        x, y = widget.x(), widget.y()
+        return (x, y, x + widget.width(), y + widget.height())
 
     def _close_overlay(self):
         """Close the overlay with animation"""
@@ -334,26 +433,32 @@ class OverlayWidget(QWidget):
         if self._closing:
             return
         self._closing = True
-        
-        if self._animation and self._animation.state() == QPropertyAnimation.Running:
-            self._animation.stop()
 
-        self._animation = QPropertyAnimation(self.opacity_effect, b"opacity")
+        if self._animation is None:
+            self._cleanup()
+            return
+        
+        self._animation.stop()
         self._animation.setDuration(200)
-        self._animation.setStartValue(1)
-        self._animation.setEndValue(0)
+        self._animation.setStartValue(self._fade)
+        self._animation.setEndValue(0.0)
         self._animation.setEasingCurve(QEasingCurve.InCubic)
-        self._animation.finished.connect(self._cleanup)
         self._animation.start()
 
+    def _on_animation_finished(self):
+        """Finish closing once the fade-out completes"""
+        if self._closing:
+            self._cleanup()
+
     def _cleanup(self):
         """Final cleanup when closing"""
         # Unregister from overlay tracker
         if self.parent():
             _OverlayTracker.unregister(self.parent(), self)
-            self.parent().removeEventFilter(self)
+            self.parent().removeEventFilter(self._resize_filter)
         
         if self._content_widget:
+            self._content_widget.removeEventFilter(self._resize_filter)
             self._content_widget.setParent(None)
             self._content_widget.deleteLater()
             self._content_widget = None
@@ -364,7 +469,7 @@ class OverlayWidget(QWidget):
 
     def resizeEvent(self, event):
         """Handle window resize"""
-        self._position_content()
+        self._schedule_reposition()
         super().resizeEvent(event)
 
     def mousePressEvent(self, event):
@@ -376,15 +481,49 @@ class OverlayWidget(QWidget):
                 return
             
             # If we clicked outside content (on overlay background), close it
+            pos = event.pos()
+            px, py = pos.x(), pos.y()
+            x0, y0, x1, y1 = self._content_bounds
+            cx0, cy0, cx1, cy1 = self._close_bounds
             if (
                 self._content_widget
-                and not self._content_widget.geometry().contains(event.pos())
-                and not self.close_button.geometry().contains(event.pos())
+                and not (x0 <= px < x1 and y0 <= py < y1)
+                and not (cx0 <= px < cx1 and cy0 <= py < cy1)
             ):
                 self._close_overlay()
         super().mousePressEvent(event)
 
 
+# Shared by every demo button; parsed once on the central widget instead of per button.
+# The close-all button is selected with the "variant" dynamic property.
+_DEMO_BUTTON_QSS = """
+    QPushButton#demoBtn {
+        padding: 10px 20px;
+        font-size: 14px;
+        margin: 5px;
+        border-radius: 6px;
+        background: #007ACC;
+        color: white;
+        border: none;
+    }
+    QPushButton#demoBtn:hover {
+        background: #005A9F;
+    }
+    QPushButton#demoBtn:pressed {
+        background: #004080;
+    }
+    QPushButton#demoBtn[variant="danger"] {
+        background: #dc3545;
+    }
+    QPushButton#demoBtn[variant="danger"]:hover {
+        background: #c82333;
+    }
+    QPushButton#demoBtn[variant="danger"]:pressed {
+        background: #bd2130;
+    }
+"""
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -393,6 +532,17 @@ class MainWindow(QMainWindow):
         
         # Create overlay manager for this window
         self.overlay_manager = OverlayManager(self)
+        
+        # Reusable delays for the second overlay of the stacking demos
+        self._second_regular_timer = QTimer(self)
+        self._second_regular_timer.setSingleShot(True)
+        self._second_regular_timer.setInterval(300)
+        self._second_regular_timer.timeout.connect(self._show_second_regular_overlay)
+        
+        self._second_nobackground_timer = QTimer(self)
+        self._second_nobackground_timer.setSingleShot(True)
+        self._second_nobackground_timer.setInterval(300)
+        self._second_nobackground_timer.timeout.connect(self._show_second_nobackground_overlay)
 
         # Create main content
         central_widget = QWidget()
@@ -459,23 +609,8 @@ class MainWindow(QMainWindow):
         
         btn_close_all = QPushButton("Close All No-Background")
         btn_close_all.clicked.connect(self.close_all_nobackground_overlays)
-        btn_close_all.setStyleSheet("""
-            QPushButton {
-                padding: 10px 20px;
-                font-size: 14px;
-                margin: 5px;
-                border-radius: 6px;
-                background: #dc3545;
-                color: white;
-                border: none;
-            }
-            QPushButton:hover {
-                background: #c82333;
-            }
-            QPushButton:pressed {
-                background: #bd2130;
-            }
-        """)
+        btn_close_all.setObjectName("demoBtn")
+        btn_close_all.setProperty("variant", "danger")
         
         multi_layout.addWidget(btn_multi_regular)
         multi_layout.addWidget(btn_multi_nobackground)
@@ -494,7 +629,7 @@ class MainWindow(QMainWindow):
         self.test_input.setStyleSheet("padding: 10px; font-size: 14px;")
         
         test_btn = QPushButton("Click Me!")
-        test_btn.clicked.connect(lambda: self.test_input.setText("Button clicked! ✓"))
+        test_btn.clicked.connect(self._on_test_button_clicked)
         
         test_layout.addWidget(self.test_input)
         test_layout.addWidget(test_btn)
@@ -513,23 +648,12 @@ class MainWindow(QMainWindow):
             btn_multi_nobackground,
             test_btn,
         ]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    padding: 10px 20px;
-                    font-size: 14px;
-                    margin: 5px;
-                    border-radius: 6px;
-                    background: #007ACC;
-                    color: white;
-                    border: none;
-                }
-                QPushButton:hover {
-                    background: #005A9F;
-                }
-                QPushButton:pressed {
-                    background: #004080;
-                }
-            """)
+            btn.setObjectName("demoBtn")
+        central_widget.setStyleSheet(_DEMO_BUTTON_QSS)
+
+    def _on_test_button_clicked(self):
+        """Confirm that the click reached the window behind the overlays"""
+        self.test_input.setText("Button clicked! ✓")
 
     def show_default_overlay(self):
         """Shows widget with default OS styling"""
@@ -747,8 +871,7 @@ class MainWindow(QMainWindow):
         btn1.clicked.connect(overlay1._close_overlay)
 
         # Second overlay (on top) - delayed slightly
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(300, lambda: self._show_second_regular_overlay())
+        self._second_regular_timer.start()
 
     def _show_second_regular_overlay(self):
         """Helper for second regular overlay"""
@@ -826,8 +949,7 @@ class MainWindow(QMainWindow):
         btn1.clicked.connect(overlay1._close_overlay)
 
         # Second overlay (smaller, positioned differently)
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(300, lambda: self._show_second_nobackground_overlay())
+        self._second_nobackground_timer.start()
 
     def _show_second_nobackground_overlay(self):
         """Helper for second nobackground overlay"""
@@ -872,6 +994,10 @@ class MainWindow(QMainWindow):
 
 
 if __name__ == "__main__":
+    # Demo-only imports, kept out of the library import path
+    import sys
+    from PySide6.QtGui import QFont
+
     app = QApplication(sys.argv)
 
     # Set nice font for the application
@@ -882,4 +1008,4 @@ if __name__ == "__main__":
 
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
+    raise SystemExit(app.exec())
@@ -1,21 +1,34 @@
-from .DrawerWidget import DrawerWidget, DrawerSide, DrawerManager
-from .OverlayWidget import OverlayWidget, OverlayManager
-from .NotificationWidget import (
-    NotificationManager,
-    NotificationItem,
-    NotificationZone,
-    NotificationSeverity,
-    SeverityStyle,
-    show_info,
-    show_success,
-    show_warning,
-    show_error,
-    show_critical,
-)
-from .utils.lookandfeel import LookAndFeel, IconTheme, ColorScheme, KDEColorScheme
+import importlib
+import sys
+import types
+
+
+# Public names are resolved on first access (PEP 562), so importing the package
+# only loads the widget modules that are actually used.
+_LAZY = {
+    # Drawer
+    "DrawerWidget": ".DrawerWidget",
+    "DrawerSide": ".DrawerWidget",
+    "DrawerManager": ".DrawerWidget",
+    # Overlay
+    "OverlayWidget": ".OverlayWidget",
+    "OverlayManager": ".OverlayWidget",
+    # Notification
+    "NotificationManager": ".NotificationWidget",
+    "NotificationItem": ".NotificationWidget",
+    "NotificationZone": ".NotificationWidget",
+    "NotificationSeverity": ".NotificationWidget",
+    "SeverityStyle": ".NotificationWidget",
+    # Utils - Look and Feel. Not part of __all__; import them from
+    # EmuPyside6Widgets.utils instead. Kept resolvable for existing callers.
+    "LookAndFeel": ".utils.lookandfeel",
+    "IconTheme": ".utils.lookandfeel",
+    "ColorScheme": ".utils.lookandfeel",
+    "KDEColorScheme": ".utils.lookandfeel",
+}
 
 
-__all__ = [
+__all__ = (
     # Drawer
     "DrawerWidget",
     "DrawerSide",
@@ -34,9 +47,62 @@ __all__ = [
     "show_warning",
     "show_error",
     "show_critical",
-    # Utils - Look and Feel
-    "LookAndFeel",
-    "IconTheme",
-    "ColorScheme",
-    "KDEColorScheme",
-]
+)
+
+
+def __getattr__(name):
+    """Import the module defining a public name on first access and cache the name"""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    # Cache every public name the module defines, not just this one: importing
+    # binds the submodule on the package under its own name (e.g. OverlayWidget),
+    # and only the class must be exported there, as the eager imports used to.
+    namespace = globals()
+    for lazy_name, lazy_module in _LAZY.items():
+        if lazy_module == module_name:
+            namespace[lazy_name] = getattr(module, lazy_name)
+    return namespace[name]
+
+
+class _Package(types.ModuleType):
+    """Package module type that keeps same-named classes exported over their submodules"""
+
+    def __setattr__(self, name, value):
+        # Importing a submodule binds it here under its own name once it has loaded,
+        # bypassing __getattr__; DrawerWidget and OverlayWidget must stay the classes.
+        if isinstance(value, types.ModuleType) and _LAZY.get(name) == f".{name}":
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+
+def _deferred_notification_helper(name):
+    """Create a stand-in for a show_* helper that imports NotificationWidget on first call"""
+    func = None
+
+    def helper(*args, **kwargs):
+        # Callers holding this stand-in keep using it, so remember the real helper too
+        nonlocal func
+        if func is None:
+            func = getattr(importlib.import_module(".NotificationWidget", __name__), name)
+            globals()[name] = func
+        return func(*args, **kwargs)
+    helper.__name__ = helper.__qualname__ = name
+    helper.__doc__ = f"Forward to NotificationWidget.{name}, importing it on first call."
+    return helper
+
+
+# Importing these, even with a star import, does not load the notification module
+show_info = _deferred_notification_helper("show_info")
+show_success = _deferred_notification_helper("show_success")
+show_warning = _deferred_notification_helper("show_warning")
+show_error = _deferred_notification_helper("show_error")
+show_critical = _deferred_notification_helper("show_critical")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
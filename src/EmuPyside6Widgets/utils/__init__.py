@@ -1,14 +1,31 @@
-from .lookandfeel import (
-    LookAndFeel,
-    IconTheme,
-    ColorScheme,
-    KDEColorScheme,
-)
+import importlib
+
 
-__all__ = [
+# Resolved on first access (PEP 562) so importing the package stays cheap
+_LAZY = {
+    "LookAndFeel": ".lookandfeel",
+    "IconTheme": ".lookandfeel",
+    "ColorScheme": ".lookandfeel",
+    "KDEColorScheme": ".lookandfeel",
+}
+
+__all__ = (
     "LookAndFeel",
     "IconTheme", 
     "ColorScheme",
     "KDEColorScheme",
-]
+)
+
+
+def __getattr__(name):
+    """Import the module defining a public name on first access and cache the name"""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -24,13 +24,17 @@ Usage:
 
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Tuple, Iterator
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 
 from PySide6.QtWidgets import QApplication, QStyleFactory, QStyle, QWidget
 from PySide6.QtGui import QPalette, QColor, QIcon, QPixmap
-from PySide6.QtCore import Qt, QDir, QFile, QSize
+from PySide6.QtCore import Qt, QDir, QFile, QSize, QTimer
 
 
 class ColorScheme(Enum):
@@ -40,6 +44,364 @@ class ColorScheme(Enum):
     SYSTEM = "system"
 
 
+# Palette roles reported by LookAndFeel.get_system_colors(), as (name, role)
+_ROLE_TABLE = (
+    # Window colors
+    ("window", QPalette.Window),
+    ("window_text", QPalette.WindowText),
+    
+    # Base colors (inputs, lists)
+    ("base", QPalette.Base),
+    ("alternate_base", QPalette.AlternateBase),
+    
+    # Text colors
+    ("text", QPalette.Text),
+    ("bright_text", QPalette.BrightText),
+    ("placeholder_text", QPalette.PlaceholderText),
+    
+    # Button colors
+    ("button", QPalette.Button),
+    ("button_text", QPalette.ButtonText),
+    
+    # Highlight/Selection colors
+    ("highlight", QPalette.Highlight),
+    ("highlighted_text", QPalette.HighlightedText),
+    
+    # Link colors
+    ("link", QPalette.Link),
+    ("link_visited", QPalette.LinkVisited),
+    
+    # Tooltip colors
+    ("tooltip_base", QPalette.ToolTipBase),
+    ("tooltip_text", QPalette.ToolTipText),
+    
+    # Other
+    ("light", QPalette.Light),
+    ("midlight", QPalette.Midlight),
+    ("mid", QPalette.Mid),
+    ("dark", QPalette.Dark),
+    ("shadow", QPalette.Shadow),
+)
+
+# Palette roles reported per color group by LookAndFeel.get_system_colors_extended()
+_GROUP_ROLE_TABLE = (
+    ("window", QPalette.Window),
+    ("window_text", QPalette.WindowText),
+    ("base", QPalette.Base),
+    ("alternate_base", QPalette.AlternateBase),
+    ("text", QPalette.Text),
+    ("bright_text", QPalette.BrightText),
+    ("button", QPalette.Button),
+    ("button_text", QPalette.ButtonText),
+    ("highlight", QPalette.Highlight),
+    ("highlighted_text", QPalette.HighlightedText),
+    ("link", QPalette.Link),
+    ("link_visited", QPalette.LinkVisited),
+)
+
+# Color groups reported by LookAndFeel.get_system_colors_extended()
+_COLOR_GROUP_TABLE = (
+    ("active", QPalette.Active),
+    ("inactive", QPalette.Inactive),
+    ("disabled", QPalette.Disabled),
+)
+
+# Stylesheet templates for LookAndFeel.get_palette_stylesheet(), filled with
+# get_system_colors() values.
+
+# Minimal: only sets text colors on widgets that need it.
+# This preserves native Qt/KDE button styles, icons, etc.
+_MINIMAL_STYLESHEET = """
+                QLabel {{
+                    color: {window_text};
+                }}
+                QGroupBox {{
+                    color: {window_text};
+                }}
+                QGroupBox::title {{
+                    color: {window_text};
+                }}
+                QCheckBox {{
+                    color: {window_text};
+                }}
+                QRadioButton {{
+                    color: {window_text};
+                }}
+            """
+
+# Full: sets all colors (may override native styling)
+_FULL_STYLESHEET = """
+                QWidget {{
+                    background-color: {window};
+                    color: {window_text};
+                }}
+                QLabel {{
+                    background-color: transparent;
+                    color: {window_text};
+                }}
+                QGroupBox {{
+                    color: {window_text};
+                }}
+                QGroupBox::title {{
+                    color: {window_text};
+                }}
+                QLineEdit, QTextEdit, QPlainTextEdit {{
+                    background-color: {base};
+                    color: {text};
+                }}
+                QComboBox QAbstractItemView {{
+                    background-color: {base};
+                    color: {text};
+                    selection-background-color: {highlight};
+                    selection-color: {highlighted_text};
+                }}
+            """
+
+# Colors used by the stylesheet templates when there is no application palette
+_STYLESHEET_FALLBACKS = {
+    "window_text": "#000000",
+    "window": "#ffffff",
+    "base": "#ffffff",
+    "text": "#000000",
+    "highlight": "#308cc6",
+    "highlighted_text": "#ffffff",
+}
+
+# Palette colors applied by LookAndFeel.force_dark_mode() / force_light_mode(),
+# as role -> (r, g, b). _FORCED_COLORS apply to every color group.
+_FORCED_COLORS = {
+    ColorScheme.DARK: {
+        # Window colors
+        QPalette.Window: (45, 45, 45),
+        QPalette.WindowText: (220, 220, 220),
+        
+        # Base colors (for text inputs, lists, etc.)
+        QPalette.Base: (35, 35, 35),
+        QPalette.AlternateBase: (50, 50, 50),
+        
+        # Text colors
+        QPalette.Text: (220, 220, 220),
+        QPalette.BrightText: (255, 255, 255),
+        
+        # Button colors
+        QPalette.Button: (55, 55, 55),
+        QPalette.ButtonText: (220, 220, 220),
+        
+        # Highlight colors
+        QPalette.Highlight: (42, 130, 218),
+        QPalette.HighlightedText: (255, 255, 255),
+        
+        # Link colors
+        QPalette.Link: (42, 130, 218),
+        QPalette.LinkVisited: (165, 122, 255),
+        
+        # Tooltip colors
+        QPalette.ToolTipBase: (60, 60, 60),
+        QPalette.ToolTipText: (220, 220, 220),
+        
+        # Placeholder text
+        QPalette.PlaceholderText: (127, 127, 127),
+    },
+    ColorScheme.LIGHT: {
+        # Window colors
+        QPalette.Window: (240, 240, 240),
+        QPalette.WindowText: (0, 0, 0),
+        
+        # Base colors
+        QPalette.Base: (255, 255, 255),
+        QPalette.AlternateBase: (245, 245, 245),
+        
+        # Text colors
+        QPalette.Text: (0, 0, 0),
+        QPalette.BrightText: (255, 255, 255),
+        
+        # Button colors
+        QPalette.Button: (240, 240, 240),
+        QPalette.ButtonText: (0, 0, 0),
+        
+        # Highlight colors
+        QPalette.Highlight: (0, 120, 215),
+        QPalette.HighlightedText: (255, 255, 255),
+        
+        # Link colors
+        QPalette.Link: (0, 102, 204),
+        QPalette.LinkVisited: (128, 0, 128),
+        
+        # Tooltip colors
+        QPalette.ToolTipBase: (255, 255, 220),
+        QPalette.ToolTipText: (0, 0, 0),
+        
+        # Placeholder text
+        QPalette.PlaceholderText: (127, 127, 127),
+    },
+}
+
+# Disabled colors, applied to the Disabled group only
+_FORCED_DISABLED_COLORS = {
+    ColorScheme.DARK: {
+        QPalette.WindowText: (127, 127, 127),
+        QPalette.Text: (127, 127, 127),
+        QPalette.ButtonText: (127, 127, 127),
+        QPalette.Highlight: (80, 80, 80),
+        QPalette.HighlightedText: (127, 127, 127),
+    },
+    ColorScheme.LIGHT: {
+        QPalette.WindowText: (127, 127, 127),
+        QPalette.Text: (127, 127, 127),
+        QPalette.ButtonText: (127, 127, 127),
+        QPalette.Highlight: (200, 200, 200),
+        QPalette.HighlightedText: (127, 127, 127),
+    },
+}
+
+
+# Semantic base colors used by LookAndFeel.get_semantic_colors()
+_SEMANTIC_TYPES = ("success", "warning", "error", "info", "critical", "neutral")
+
+_SEMANTIC_DARK = {
+    "success": "#27ae60",          # Green
+    "success_light": "#2ecc71",
+    "success_dark": "#1e8449",
+    
+    "warning": "#f39c12",          # Orange
+    "warning_light": "#f1c40f",
+    "warning_dark": "#d68910",
+    
+    "error": "#e74c3c",            # Red
+    "error_light": "#ec7063",
+    "error_dark": "#c0392b",
+    
+    "info": "#3498db",             # Blue
+    "info_light": "#5dade2",
+    "info_dark": "#2980b9",
+    
+    "critical": "#8e44ad",         # Purple
+    "critical_light": "#a569bd",
+    "critical_dark": "#6c3483",
+    
+    "neutral": "#95a5a6",          # Gray
+    "neutral_light": "#bdc3c7",
+    "neutral_dark": "#7f8c8d",
+}
+
+_SEMANTIC_LIGHT = {
+    "success": "#28a745",
+    "success_light": "#48c774",
+    "success_dark": "#1e7e34",
+    
+    "warning": "#ffc107",
+    "warning_light": "#ffdb4d",
+    "warning_dark": "#d39e00",
+    
+    "error": "#dc3545",
+    "error_light": "#f17a85",
+    "error_dark": "#bd2130",
+    
+    "info": "#17a2b8",
+    "info_light": "#4fc3dc",
+    "info_dark": "#117a8b",
+    
+    "critical": "#6f42c1",
+    "critical_light": "#9775d9",
+    "critical_dark": "#5a32a3",
+    
+    "neutral": "#6c757d",
+    "neutral_light": "#adb5bd",
+    "neutral_dark": "#495057",
+}
+
+
+# Gamma correction (sRGB to linear) for every 8-bit channel value
+_SRGB_TO_LINEAR = tuple(
+    c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+    for c in (i / 255 for i in range(256))
+)
+
+
+def _rgb_luminance(rgb: int) -> float:
+    """WCAG relative luminance of a packed 0xRRGGBB color"""
+    # Calculate luminance using WCAG coefficients
+    return (0.2126 * _SRGB_TO_LINEAR[rgb >> 16] +
+            0.7152 * _SRGB_TO_LINEAR[(rgb >> 8) & 0xFF] +
+            0.0722 * _SRGB_TO_LINEAR[rgb & 0xFF])
+
+
+@lru_cache(maxsize=512)
+def _name_luminance(name: str) -> float:
+    """WCAG relative luminance of a color name or hex string"""
+    # "#rrggbb" is decoded directly; other names go through QColor's parser
+    if len(name) == 7 and name[0] == "#" and name[1:].isalnum():
+        try:
+            return _rgb_luminance(int(name[1:], 16))
+        except ValueError:
+            pass
+    return _rgb_luminance(QColor(name).rgb() & 0xFFFFFF)
+
+
+def _color_name(color) -> str:
+    """Hashable cache key for a QColor, hex string, or RGB tuple"""
+    if isinstance(color, str):
+        return color
+    if isinstance(color, tuple):
+        return QColor(*color).name()
+    return color.name()
+
+
+@lru_cache(maxsize=512)
+def _contrast_ratio(name1: str, name2: str) -> float:
+    """WCAG contrast ratio between two color names or hex strings"""
+    lum1 = _name_luminance(name1)
+    lum2 = _name_luminance(name2)
+    return (max(lum1, lum2) + 0.05) / (min(lum1, lum2) + 0.05)
+
+
+@lru_cache(maxsize=512)
+def _contrasting_color(name: str, prefer_tinted: bool) -> str:
+    """Readable text color for a background color name or hex string"""
+    luminance = _name_luminance(name)
+    if not prefer_tinted:
+        return "#ffffff" if luminance < 0.179 else "#000000"
+    
+    # Create a tinted version that's harmonious with the background
+    h, s, l, a = QColor(name).getHslF()
+    
+    if luminance < 0.179:
+        # Dark background - use light tinted text
+        # Reduce saturation and increase lightness
+        new_s = max(0, s * 0.3)
+        new_l = min(1, 0.9 + (1 - l) * 0.1)
+    else:
+        # Light background - use dark tinted text
+        # Reduce saturation and decrease lightness
+        new_s = max(0, s * 0.4)
+        new_l = max(0, 0.1 + l * 0.1)
+    
+    result = QColor()
+    result.setHslF(h, new_s, new_l, a)
+    return result.name()
+
+
+# The running QApplication, looked up once and forgotten when it quits or is destroyed
+_app: Optional[QApplication] = None
+
+
+def _get_app() -> Optional[QApplication]:
+    """Get the QApplication instance, or None if none exists yet"""
+    global _app
+    if _app is None:
+        _app = QApplication.instance()
+        if _app is not None:
+            _app.aboutToQuit.connect(_reset_app)
+            _app.destroyed.connect(_reset_app)
+    return _app
+
+
+def _reset_app(*args):
+    """Forget the cached application so the next lookup queries Qt again"""
+    global _app
+    _app = None
+
+
 class LookAndFeel:
     """
     Utilities for managing application look and feel.
@@ -52,6 +414,40 @@ class LookAndFeel:
     
     _forced_scheme: Optional[ColorScheme] = None
     _original_palette: Optional[QPalette] = None
+    # Style names from QStyleFactory, which do not change while the app runs
+    _available_styles: Optional[Tuple[str, ...]] = None
+    _available_styles_lower: frozenset = frozenset()
+    
+    # Forced palettes are built on first use and reused; Qt shares their data on apply
+    _forced_palettes: Dict[ColorScheme, QPalette] = {}
+    
+    # Computed colors and stylesheets, keyed by QPalette.cacheKey(). Callers receive
+    # copies of the dicts, so the cached ones stay intact.
+    _CACHE_SIZE = 4
+    _colors_cache: Dict[int, Dict[str, str]] = {}
+    _extended_cache: Dict[int, Dict[str, Dict[str, str]]] = {}
+    _stylesheet_cache: Dict[Tuple[int, bool], str] = {}
+    # Dark mode as detected from the palette; reset by the listener on theme changes
+    _detected_dark: Optional[bool] = None
+    _listener_app: Optional[QApplication] = None
+    # A widget refresh is queued on the event loop
+    _refresh_pending: bool = False
+    
+    @classmethod
+    def _cache_store(cls, cache: dict, key, value):
+        """Store a value in one of the color caches, dropping the oldest entry when full"""
+        if len(cache) >= cls._CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = value
+        return value
+    
+    @classmethod
+    def _clear_color_caches(cls):
+        """Drop all cached color dictionaries, stylesheets and the detected dark mode"""
+        cls._colors_cache.clear()
+        cls._extended_cache.clear()
+        cls._stylesheet_cache.clear()
+        cls._detected_dark = None
     
     # ==================== Dark/Light Mode ====================
     
@@ -69,18 +465,37 @@ class LookAndFeel:
             return False
         
         # Check system palette
-        app = QApplication.instance()
+        app = _get_app()
         if app:
-            palette = app.palette()
-            # Compare window background luminance
-            bg_color = palette.color(QPalette.Window)
-            # Calculate relative luminance
-            luminance = (0.299 * bg_color.red() + 
-                        0.587 * bg_color.green() + 
-                        0.114 * bg_color.blue()) / 255
-            return luminance < 0.5
+            # Detected once, then kept until the palette or system scheme changes
+            if cls._listener_app is not app:
+                cls._install_listener(app)
+            if cls._detected_dark is None:
+                palette = app.palette()
+                # Compare window background luminance
+                bg_color = palette.color(QPalette.Window)
+                # Rec. 601 luma below half scale, in integer form:
+                # (0.299 R + 0.587 G + 0.114 B) / 255 < 0.5
+                cls._detected_dark = (299 * bg_color.red() +
+                                      587 * bg_color.green() +
+                                      114 * bg_color.blue()) < 127500
+            return cls._detected_dark
         return False
     
+    @classmethod
+    def _install_listener(cls, app):
+        """Invalidate cached detection results whenever the application palette or system scheme changes"""
+        app.paletteChanged.connect(cls._on_theme_changed)
+        style_hints = app.styleHints()
+        if hasattr(style_hints, "colorSchemeChanged"):  # Qt 6.5+
+            style_hints.colorSchemeChanged.connect(cls._on_theme_changed)
+        cls._listener_app = app
+    
+    @classmethod
+    def _on_theme_changed(cls, *args):
+        """Drop cached detection results after a palette or color scheme change"""
+        cls._clear_color_caches()
+    
     @classmethod
     def is_light_mode(cls) -> bool:
         """
@@ -110,62 +525,7 @@ class LookAndFeel:
         
         Creates a dark palette and applies it to the application.
         """
-        app = QApplication.instance()
-        if not app:
-            return
-        
-        # Store original palette if not already stored
-        if cls._original_palette is None:
-            cls._original_palette = app.palette()
-        
-        cls._forced_scheme = ColorScheme.DARK
-        
-        # Create dark palette
-        dark_palette = QPalette()
-        
-        # Window colors
-        dark_palette.setColor(QPalette.Window, QColor(45, 45, 45))
-        dark_palette.setColor(QPalette.WindowText, QColor(220, 220, 220))
-        
-        # Base colors (for text inputs, lists, etc.)
-        dark_palette.setColor(QPalette.Base, QColor(35, 35, 35))
-        dark_palette.setColor(QPalette.AlternateBase, QColor(50, 50, 50))
-        
-        # Text colors
-        dark_palette.setColor(QPalette.Text, QColor(220, 220, 220))
-        dark_palette.setColor(QPalette.BrightText, QColor(255, 255, 255))
-        
-        # Button colors
-        dark_palette.setColor(QPalette.Button, QColor(55, 55, 55))
-        dark_palette.setColor(QPalette.ButtonText, QColor(220, 220, 220))
-        
-        # Highlight colors
-        dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
-        
-        # Link colors
-        dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
-        dark_palette.setColor(QPalette.LinkVisited, QColor(165, 122, 255))
-        
-        # Disabled colors
-        dark_palette.setColor(QPalette.Disabled, QPalette.WindowText, QColor(127, 127, 127))
-        dark_palette.setColor(QPalette.Disabled, QPalette.Text, QColor(127, 127, 127))
-        dark_palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(127, 127, 127))
-        dark_palette.setColor(QPalette.Disabled, QPalette.Highlight, QColor(80, 80, 80))
-        dark_palette.setColor(QPalette.Disabled, QPalette.HighlightedText, QColor(127, 127, 127))
-        
-        # Tooltip colors
-        dark_palette.setColor(QPalette.ToolTipBase, QColor(60, 60, 60))
-        dark_palette.setColor(QPalette.ToolTipText, QColor(220, 220, 220))
-        
-        # Placeholder text
-        dark_palette.setColor(QPalette.PlaceholderText, QColor(127, 127, 127))
-        
-        app.setPalette(dark_palette)
-        
-        # Apply stylesheet and refresh
-        cls.apply_palette_stylesheet()
-        cls.refresh_widgets()
+        cls._apply_forced_palette(ColorScheme.DARK)
     
     @classmethod
     def force_light_mode(cls):
@@ -174,7 +534,12 @@ class LookAndFeel:
         
         Creates a light palette and applies it to the application.
         """
-        app = QApplication.instance()
+        cls._apply_forced_palette(ColorScheme.LIGHT)
+    
+    @classmethod
+    def _apply_forced_palette(cls, scheme: ColorScheme):
+        """Apply the built-in palette for a forced color scheme"""
+        app = _get_app()
         if not app:
             return
         
@@ -182,54 +547,30 @@ class LookAndFeel:
         if cls._original_palette is None:
             cls._original_palette = app.palette()
         
-        cls._forced_scheme = ColorScheme.LIGHT
-        
-        # Create light palette
-        light_palette = QPalette()
-        
-        # Window colors
-        light_palette.setColor(QPalette.Window, QColor(240, 240, 240))
-        light_palette.setColor(QPalette.WindowText, QColor(0, 0, 0))
-        
-        # Base colors
-        light_palette.setColor(QPalette.Base, QColor(255, 255, 255))
-        light_palette.setColor(QPalette.AlternateBase, QColor(245, 245, 245))
-        
-        # Text colors
-        light_palette.setColor(QPalette.Text, QColor(0, 0, 0))
-        light_palette.setColor(QPalette.BrightText, QColor(255, 255, 255))
-        
-        # Button colors
-        light_palette.setColor(QPalette.Button, QColor(240, 240, 240))
-        light_palette.setColor(QPalette.ButtonText, QColor(0, 0, 0))
-        
-        # Highlight colors
-        light_palette.setColor(QPalette.Highlight, QColor(0, 120, 215))
-        light_palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
-        
-        # Link colors
-        light_palette.setColor(QPalette.Link, QColor(0, 102, 204))
-        light_palette.setColor(QPalette.LinkVisited, QColor(128, 0, 128))
-        
-        # Disabled colors
-        light_palette.setColor(QPalette.Disabled, QPalette.WindowText, QColor(127, 127, 127))
-        light_palette.setColor(QPalette.Disabled, QPalette.Text, QColor(127, 127, 127))
-        light_palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(127, 127, 127))
-        light_palette.setColor(QPalette.Disabled, QPalette.Highlight, QColor(200, 200, 200))
-        light_palette.setColor(QPalette.Disabled, QPalette.HighlightedText, QColor(127, 127, 127))
-        
-        # Tooltip colors
-        light_palette.setColor(QPalette.ToolTipBase, QColor(255, 255, 220))
-        light_palette.setColor(QPalette.ToolTipText, QColor(0, 0, 0))
+        cls._forced_scheme = scheme
         
-        # Placeholder text
-        light_palette.setColor(QPalette.PlaceholderText, QColor(127, 127, 127))
+        palette = cls._forced_palettes.get(scheme)
+        if palette is None:
+            palette = cls._forced_palettes[scheme] = cls._build_forced_palette(scheme)
         
-        app.setPalette(light_palette)
+        app.setPalette(palette)
+        cls._clear_color_caches()
         
         # Apply stylesheet and refresh
         cls.apply_palette_stylesheet()
-        cls.refresh_widgets()
+        cls._schedule_refresh()
+    
+    @staticmethod
+    def _build_forced_palette(scheme: ColorScheme) -> QPalette:
+        """Create the palette for a forced color scheme from its color table"""
+        # Unset roles resolve against the base palette when applied
+        palette = QPalette()
+        for role, rgb in _FORCED_COLORS[scheme].items():
+            palette.setColor(role, QColor(*rgb))
+        disabled = QPalette.Disabled
+        for role, rgb in _FORCED_DISABLED_COLORS[scheme].items():
+            palette.setColor(disabled, role, QColor(*rgb))
+        return palette
     
     @classmethod
     def reset_color_scheme(cls):
@@ -240,12 +581,32 @@ class LookAndFeel:
         """
         cls._forced_scheme = ColorScheme.SYSTEM
         
-        app = QApplication.instance()
+        app = _get_app()
         if app and cls._original_palette:
             app.setPalette(cls._original_palette)
+            cls._clear_color_caches()
             # Clear stylesheet
             app.setStyleSheet("")
-            cls.refresh_widgets()
+            cls._schedule_refresh()
+    
+    @classmethod
+    def _schedule_refresh(cls):
+        """
+        Refresh all widgets once control returns to the event loop.
+        
+        Theme switches in quick succession (startup code, a settings dialog
+        flipping schemes) share a single refresh of the widget tree.
+        """
+        if cls._refresh_pending or not _get_app():
+            return
+        cls._refresh_pending = True
+        QTimer.singleShot(0, cls._run_scheduled_refresh)
+    
+    @classmethod
+    def _run_scheduled_refresh(cls):
+        """Run the refresh queued by _schedule_refresh()"""
+        cls._refresh_pending = False
+        cls.refresh_widgets()
     
     @classmethod
     def refresh_widgets(cls, widget=None):
@@ -258,23 +619,21 @@ class LookAndFeel:
         Args:
             widget: Specific widget to refresh, or None for all top-level widgets
         """
-        app = QApplication.instance()
+        app = _get_app()
         if not app:
             return
         
-        if widget:
-            widget.style().unpolish(widget)
-            widget.style().polish(widget)
-            widget.update()
-            # Refresh all children
-            for child in widget.findChildren(QWidget):
-                child.style().unpolish(child)
-                child.style().polish(child)
-                child.update()
-        else:
-            # Refresh all top-level widgets
-            for window in app.topLevelWidgets():
-                cls.refresh_widgets(window)
+        # Walk the widget (or every top-level window) and its descendants with an
+        # explicit stack; a widget's parent is always a widget, so widget children suffice
+        stack = [widget] if widget else app.topLevelWidgets()
+        while stack:
+            target = stack.pop()
+            # Widgets can carry their own style, so look it up once per widget
+            style = target.style()
+            style.unpolish(target)
+            style.polish(target)
+            target.update()
+            stack.extend(child for child in target.children() if child.isWidgetType())
     
     @classmethod
     def get_palette_stylesheet(cls, minimal: bool = True) -> str:
@@ -291,56 +650,19 @@ class LookAndFeel:
         Returns:
             CSS stylesheet string with color definitions
         """
-        colors = cls.get_system_colors()
+        app = _get_app()
+        key = (app.palette().cacheKey() if app else 0, minimal)
+        cached = cls._stylesheet_cache.get(key)
+        if cached is not None:
+            return cached
         
-        if minimal:
-            # Minimal stylesheet - only set text colors on widgets that need it
-            # This preserves native Qt/KDE button styles, icons, etc.
-            return f"""
-                QLabel {{
-                    color: {colors.get('window_text', '#000000')};
-                }}
-                QGroupBox {{
-                    color: {colors.get('window_text', '#000000')};
-                }}
-                QGroupBox::title {{
-                    color: {colors.get('window_text', '#000000')};
-                }}
-                QCheckBox {{
-                    color: {colors.get('window_text', '#000000')};
-                }}
-                QRadioButton {{
-                    color: {colors.get('window_text', '#000000')};
-                }}
-            """
-        else:
-            # Full stylesheet - sets all colors (may override native styling)
-            return f"""
-                QWidget {{
-                    background-color: {colors.get('window', '#ffffff')};
-                    color: {colors.get('window_text', '#000000')};
-                }}
-                QLabel {{
-                    background-color: transparent;
-                    color: {colors.get('window_text', '#000000')};
-                }}
-                QGroupBox {{
-                    color: {colors.get('window_text', '#000000')};
-                }}
-                QGroupBox::title {{
-                    color: {colors.get('window_text', '#000000')};
-                }}
-                QLineEdit, QTextEdit, QPlainTextEdit {{
-                    background-color: {colors.get('base', '#ffffff')};
-                    color: {colors.get('text', '#000000')};
-                }}
-                QComboBox QAbstractItemView {{
-                    background-color: {colors.get('base', '#ffffff')};
-                    color: {colors.get('text', '#000000')};
-                    selection-background-color: {colors.get('highlight', '#308cc6')};
-                    selection-color: {colors.get('highlighted_text', '#ffffff')};
-                }}
-            """
+        colors = cls._system_colors()
+        
+        # The color dict has every role, or is empty when there is no application yet
+        template = _MINIMAL_STYLESHEET if minimal else _FULL_STYLESHEET
+        stylesheet = template.format_map(colors or _STYLESHEET_FALLBACKS)
+        
+        return cls._cache_store(cls._stylesheet_cache, key, stylesheet)
     
     @classmethod
     def apply_palette_stylesheet(cls, widget=None, minimal: bool = True):
@@ -357,7 +679,7 @@ class LookAndFeel:
         """
         stylesheet = cls.get_palette_stylesheet(minimal=minimal)
         
-        app = QApplication.instance()
+        app = _get_app()
         if not app:
             return
         
@@ -393,7 +715,15 @@ class LookAndFeel:
         Returns:
             List of style names
         """
-        return QStyleFactory.keys()
+        return list(cls._style_keys())
+    
+    @classmethod
+    def _style_keys(cls) -> Tuple[str, ...]:
+        """Get the available style names, queried from Qt once"""
+        if cls._available_styles is None:
+            cls._available_styles = tuple(QStyleFactory.keys())
+            cls._available_styles_lower = frozenset(key.lower() for key in cls._available_styles)
+        return cls._available_styles
     
     @classmethod
     def get_current_style(cls) -> Optional[str]:
@@ -403,7 +733,7 @@ class LookAndFeel:
         Returns:
             Style name or None if no application exists
         """
-        app = QApplication.instance()
+        app = _get_app()
         if app and app.style():
             return app.style().objectName()
         return None
@@ -419,10 +749,19 @@ class LookAndFeel:
         Returns:
             True if successful, False otherwise
         """
-        app = QApplication.instance()
+        app = _get_app()
         if not app:
             return False
         
+        # Style names are case-insensitive. Unknown names need no factory call, and
+        # re-applying the active style would only repolish every widget for nothing.
+        name = style_name.lower()
+        cls._style_keys()
+        if name not in cls._available_styles_lower:
+            return False
+        if app.style() and app.style().objectName().lower() == name:
+            return True
+        
         style = QStyleFactory.create(style_name)
         if style:
             app.setStyle(style)
@@ -439,51 +778,24 @@ class LookAndFeel:
         Returns:
             Dictionary with color role names and hex color values
         """
-        app = QApplication.instance()
+        return dict(cls._system_colors())
+    
+    @classmethod
+    def _system_colors(cls) -> Dict[str, str]:
+        """Get the cached color dictionary for the current palette (not to be modified)"""
+        app = _get_app()
         if not app:
             return {}
         
         palette = app.palette()
+        cached = cls._colors_cache.get(palette.cacheKey())
+        if cached is not None:
+            return cached
         
-        colors = {
-            # Window colors
-            "window": palette.color(QPalette.Window).name(),
-            "window_text": palette.color(QPalette.WindowText).name(),
-            
-            # Base colors (inputs, lists)
-            "base": palette.color(QPalette.Base).name(),
-            "alternate_base": palette.color(QPalette.AlternateBase).name(),
-            
-            # Text colors
-            "text": palette.color(QPalette.Text).name(),
-            "bright_text": palette.color(QPalette.BrightText).name(),
-            "placeholder_text": palette.color(QPalette.PlaceholderText).name(),
-            
-            # Button colors
-            "button": palette.color(QPalette.Button).name(),
-            "button_text": palette.color(QPalette.ButtonText).name(),
-            
-            # Highlight/Selection colors
-            "highlight": palette.color(QPalette.Highlight).name(),
-            "highlighted_text": palette.color(QPalette.HighlightedText).name(),
-            
-            # Link colors
-            "link": palette.color(QPalette.Link).name(),
-            "link_visited": palette.color(QPalette.LinkVisited).name(),
-            
-            # Tooltip colors
-            "tooltip_base": palette.color(QPalette.ToolTipBase).name(),
-            "tooltip_text": palette.color(QPalette.ToolTipText).name(),
-            
-            # Other
-            "light": palette.color(QPalette.Light).name(),
-            "midlight": palette.color(QPalette.Midlight).name(),
-            "mid": palette.color(QPalette.Mid).name(),
-            "dark": palette.color(QPalette.Dark).name(),
-            "shadow": palette.color(QPalette.Shadow).name(),
-        }
+        # Hex straight from the packed RGB value, skipping QColor.name()
+        colors = {name: f"#{palette.color(role).rgb() & 0xFFFFFF:06x}" for name, role in _ROLE_TABLE}
         
-        return colors
+        return cls._cache_store(cls._colors_cache, palette.cacheKey(), colors)
     
     @classmethod
     def get_system_colors_extended(cls) -> Dict[str, Dict[str, str]]:
@@ -493,33 +805,24 @@ class LookAndFeel:
         Returns:
             Dictionary with color groups containing role names and hex values
         """
-        app = QApplication.instance()
+        app = _get_app()
         if not app:
             return {}
         
         palette = app.palette()
-        
-        def get_colors_for_group(group: QPalette.ColorGroup) -> Dict[str, str]:
-            return {
-                "window": palette.color(group, QPalette.Window).name(),
-                "window_text": palette.color(group, QPalette.WindowText).name(),
-                "base": palette.color(group, QPalette.Base).name(),
-                "alternate_base": palette.color(group, QPalette.AlternateBase).name(),
-                "text": palette.color(group, QPalette.Text).name(),
-                "bright_text": palette.color(group, QPalette.BrightText).name(),
-                "button": palette.color(group, QPalette.Button).name(),
-                "button_text": palette.color(group, QPalette.ButtonText).name(),
-                "highlight": palette.color(group, QPalette.Highlight).name(),
-                "highlighted_text": palette.color(group, QPalette.HighlightedText).name(),
-                "link": palette.color(group, QPalette.Link).name(),
-                "link_visited": palette.color(group, QPalette.LinkVisited).name(),
+        cached = cls._extended_cache.get(palette.cacheKey())
+        if cached is not None:
+            return {group: dict(colors) for group, colors in cached.items()}
+        
+        extended = {
+            group_name: {
+                name: f"#{palette.color(group, role).rgb() & 0xFFFFFF:06x}"
+                for name, role in _GROUP_ROLE_TABLE
             }
-        
-        return {
-            "active": get_colors_for_group(QPalette.Active),
-            "inactive": get_colors_for_group(QPalette.Inactive),
-            "disabled": get_colors_for_group(QPalette.Disabled),
+            for group_name, group in _COLOR_GROUP_TABLE
         }
+        cls._cache_store(cls._extended_cache, palette.cacheKey(), extended)
+        return {group: dict(colors) for group, colors in extended.items()}
     
     @classmethod
     def get_semantic_colors(cls) -> Dict[str, str]:
@@ -546,76 +849,8 @@ class LookAndFeel:
                 color: {colors['success_text']};
             ''')
         """
-        is_dark = cls.is_dark_mode()
-        
-        if is_dark:
-            base_colors = {
-                "success": "#27ae60",          # Green
-                "success_light": "#2ecc71",
-                "success_dark": "#1e8449",
-                
-                "warning": "#f39c12",          # Orange
-                "warning_light": "#f1c40f",
-                "warning_dark": "#d68910",
-                
-                "error": "#e74c3c",            # Red
-                "error_light": "#ec7063",
-                "error_dark": "#c0392b",
-                
-                "info": "#3498db",             # Blue
-                "info_light": "#5dade2",
-                "info_dark": "#2980b9",
-                
-                "critical": "#8e44ad",         # Purple
-                "critical_light": "#a569bd",
-                "critical_dark": "#6c3483",
-                
-                "neutral": "#95a5a6",          # Gray
-                "neutral_light": "#bdc3c7",
-                "neutral_dark": "#7f8c8d",
-            }
-        else:
-            base_colors = {
-                "success": "#28a745",
-                "success_light": "#48c774",
-                "success_dark": "#1e7e34",
-                
-                "warning": "#ffc107",
-                "warning_light": "#ffdb4d",
-                "warning_dark": "#d39e00",
-                
-                "error": "#dc3545",
-                "error_light": "#f17a85",
-                "error_dark": "#bd2130",
-                
-                "info": "#17a2b8",
-                "info_light": "#4fc3dc",
-                "info_dark": "#117a8b",
-                
-                "critical": "#6f42c1",
-                "critical_light": "#9775d9",
-                "critical_dark": "#5a32a3",
-                
-                "neutral": "#6c757d",
-                "neutral_light": "#adb5bd",
-                "neutral_dark": "#495057",
-            }
-        
-        # Add text color variants for each semantic color
-        colors_with_text = dict(base_colors)
-        
-        # Define the semantic color types
-        semantic_types = ["success", "warning", "error", "info", "critical", "neutral"]
-        
-        for sem_type in semantic_types:
-            # Text color for base
-            colors_with_text[f"{sem_type}_text"] = cls.get_contrasting_color(base_colors[sem_type])
-            # Text color for light variant
-            colors_with_text[f"{sem_type}_light_text"] = cls.get_contrasting_color(base_colors[f"{sem_type}_light"])
-            # Text color for dark variant
-            colors_with_text[f"{sem_type}_dark_text"] = cls.get_contrasting_color(base_colors[f"{sem_type}_dark"])
-        
-        return colors_with_text
+        # Both palettes are constant and precomputed; hand out a copy
+        return dict(_SEMANTIC_DARK_COLORS if cls.is_dark_mode() else _SEMANTIC_LIGHT_COLORS)
     
     @classmethod
     def get_color(cls, role: str) -> Optional[QColor]:
@@ -628,7 +863,7 @@ class LookAndFeel:
         Returns:
             QColor object or None if role not found
         """
-        colors = cls.get_system_colors()
+        colors = cls._system_colors()
         if role in colors:
             return QColor(colors[role])
         return None
@@ -648,27 +883,16 @@ class LookAndFeel:
         Returns:
             Luminance value between 0 (black) and 1 (white)
         """
-        # Convert to QColor if needed
+        # Results are memoized per color, so repeated lookups skip the gamma math
         if isinstance(color, str):
-            color = QColor(color)
+            return _name_luminance(color)
         elif isinstance(color, tuple):
+            # In-range 8-bit channels index the lookup table without a QColor
+            r, g, b = color[:3]
+            if type(r) is int and type(g) is int and type(b) is int and not (r | g | b) >> 8:
+                return _rgb_luminance((r << 16) | (g << 8) | b)
             color = QColor(*color)
-        
-        # Get RGB values normalized to 0-1
-        r = color.redF()
-        g = color.greenF()
-        b = color.blueF()
-        
-        # Apply gamma correction (sRGB to linear)
-        def linearize(c):
-            return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
-        
-        r_lin = linearize(r)
-        g_lin = linearize(g)
-        b_lin = linearize(b)
-        
-        # Calculate luminance using WCAG coefficients
-        return 0.2126 * r_lin + 0.7152 * g_lin + 0.0722 * b_lin
+        return _rgb_luminance(color.rgb() & 0xFFFFFF)
     
     @staticmethod
     def get_contrast_ratio(color1, color2) -> float:
@@ -687,13 +911,8 @@ class LookAndFeel:
         Returns:
             Contrast ratio (1 to 21)
         """
-        lum1 = LookAndFeel.get_luminance(color1)
-        lum2 = LookAndFeel.get_luminance(color2)
-        
-        lighter = max(lum1, lum2)
-        darker = min(lum1, lum2)
-        
-        return (lighter + 0.05) / (darker + 0.05)
+        # Memoized per pair of color names; QColor and tuple inputs are named first
+        return _contrast_ratio(_color_name(color1), _color_name(color2))
     
     @staticmethod
     def get_contrasting_text_color(bg_color, light_text: str = "#ffffff", dark_text: str = "#000000") -> str:
@@ -737,35 +956,8 @@ class LookAndFeel:
             >>> LookAndFeel.get_contrasting_color("#ffc107")  # Yellow
             '#000000'  # Black text on yellow
         """
-        if isinstance(bg_color, str):
-            bg_qcolor = QColor(bg_color)
-        elif isinstance(bg_color, tuple):
-            bg_qcolor = QColor(*bg_color)
-        else:
-            bg_qcolor = bg_color
-        
-        luminance = LookAndFeel.get_luminance(bg_qcolor)
-        
-        if prefer_tinted:
-            # Create a tinted version that's harmonious with the background
-            h, s, l, a = bg_qcolor.getHslF()
-            
-            if luminance < 0.179:
-                # Dark background - use light tinted text
-                # Reduce saturation and increase lightness
-                new_s = max(0, s * 0.3)
-                new_l = min(1, 0.9 + (1 - l) * 0.1)
-            else:
-                # Light background - use dark tinted text
-                # Reduce saturation and decrease lightness
-                new_s = max(0, s * 0.4)
-                new_l = max(0, 0.1 + l * 0.1)
-            
-            result = QColor()
-            result.setHslF(h, new_s, new_l, a)
-            return result.name()
-        else:
-            return "#ffffff" if luminance < 0.179 else "#000000"
+        # Memoized per color name; QColor and tuple inputs are named first
+        return _contrasting_color(_color_name(bg_color), prefer_tinted)
     
     @classmethod
     def ensure_contrast(cls, fg_color, bg_color, min_ratio: float = 4.5) -> str:
@@ -783,7 +975,12 @@ class LookAndFeel:
         Returns:
             Hex color string with sufficient contrast
         """
-        ratio = cls.get_contrast_ratio(fg_color, bg_color)
+        # Background luminance is shared by the ratio and the fallback choice
+        bg_luminance = cls.get_luminance(bg_color)
+        fg_luminance = cls.get_luminance(fg_color)
+        lighter = max(fg_luminance, bg_luminance)
+        darker = min(fg_luminance, bg_luminance)
+        ratio = (lighter + 0.05) / (darker + 0.05)
         
         if ratio >= min_ratio:
             # Already sufficient contrast
@@ -795,7 +992,59 @@ class LookAndFeel:
                 return QColor(*fg_color).name()
         
         # Insufficient contrast - return appropriate black or white
-        return cls.get_contrasting_text_color(bg_color)
+        # (same threshold as get_contrasting_text_color)
+        return "#ffffff" if bg_luminance < 0.179 else "#000000"
+
+
+def _build_semantic_colors(base_colors: Dict[str, str]) -> Dict[str, str]:
+    """Add the readable text color for each semantic base, light and dark variant"""
+    colors_with_text = dict(base_colors)
+    
+    for sem_type in _SEMANTIC_TYPES:
+        # Text color for base
+        colors_with_text[f"{sem_type}_text"] = LookAndFeel.get_contrasting_color(base_colors[sem_type])
+        # Text color for light variant
+        colors_with_text[f"{sem_type}_light_text"] = LookAndFeel.get_contrasting_color(base_colors[f"{sem_type}_light"])
+        # Text color for dark variant
+        colors_with_text[f"{sem_type}_dark_text"] = LookAndFeel.get_contrasting_color(base_colors[f"{sem_type}_dark"])
+    
+    return colors_with_text
+
+
+# Final semantic palettes returned by LookAndFeel.get_semantic_colors()
+_SEMANTIC_DARK_COLORS = _build_semantic_colors(_SEMANTIC_DARK)
+_SEMANTIC_LIGHT_COLORS = _build_semantic_colors(_SEMANTIC_LIGHT)
+
+
+@lru_cache(maxsize=512)
+def _parse_kde_components(color_str: str) -> Optional[Tuple[int, ...]]:
+    """Split a KDE "R,G,B" or "R,G,B,A" color string into its integer components"""
+    try:
+        parts = tuple(int(p.strip()) for p in color_str.split(','))
+    except ValueError:
+        return None
+    return parts if len(parts) in (3, 4) else None
+
+
+@lru_cache(maxsize=512)
+def _kde_color_hex(color_str: str) -> Optional[str]:
+    """Hex name of a KDE color string, as QColor.name() gives it, without a QColor"""
+    parts = _parse_kde_components(color_str)
+    if parts is None:
+        return None
+    r, g, b = parts[:3]
+    if not (r | g | b) >> 8:
+        return f"#{r:02x}{g:02x}{b:02x}"
+    # Out-of-range components make an invalid QColor; keep its name
+    return QColor(*parts).name()
+
+
+def _group_by_section(mapping: Dict[Tuple[str, str], tuple]) -> Dict[str, List[Tuple[str, tuple]]]:
+    """Group a {(section, key): value} mapping into {section: [(key, value), ...]}"""
+    grouped = {}
+    for (section, key), value in mapping.items():
+        grouped.setdefault(section, []).append((key, value))
+    return grouped
 
 
 class KDEColorScheme:
@@ -821,14 +1070,24 @@ class KDEColorScheme:
     """
     
     _current_scheme: Optional[str] = None
-    _scheme_cache: Dict[str, Dict] = {}
+    # Parsed scheme files by path as (mtime_ns, size, parsed), oldest dropped first once full.
+    # Stores take the lock, since the scheme index parses files on worker threads.
+    _scheme_cache: Dict[str, Tuple[int, int, Dict]] = {}
+    _scheme_cache_lock = threading.Lock()
+    _SCHEME_CACHE_SIZE = 64
+    # get_scheme_info() results by name as (parsed, info); valid while the name
+    # still resolves to that same parsed dict
+    _info_cache: Dict[str, Tuple[Dict, Dict]] = {}
     
-    # Standard KDE color scheme directories
-    _SCHEME_DIRS = [
-        Path.home() / ".local/share/color-schemes",
-        Path("/usr/share/color-schemes"),
-        Path("/usr/local/share/color-schemes"),
-    ]
+    # Scheme count from which the index parses files in parallel
+    _PARALLEL_PARSE_MIN = 8
+    
+    # Standard KDE color scheme directories, resolved on first use by _scheme_dirs()
+    _SCHEME_DIRS: Optional[List[Path]] = None
+    
+    # Installed schemes by lowercased file stem and display name, built on first use
+    _scheme_index: Optional[Dict[str, Path]] = None
+    _scheme_names: List[str] = []
     
     # Color role mapping from KDE to QPalette
     _KDE_TO_QPALETTE = {
@@ -857,6 +1116,140 @@ class KDEColorScheme:
         ("Colors:Tooltip", "ForegroundNormal"): (QPalette.ToolTipText,),
     }
     
+    # The same mapping grouped by section, so each section is looked up once
+    _KDE_TO_QPALETTE_BY_SECTION = _group_by_section(_KDE_TO_QPALETTE)
+    
+    # 3D shades derived from the window background, as (role, QColor method, factor)
+    _WINDOW_SHADES = (
+        (QPalette.Light, QColor.lighter, 150),
+        (QPalette.Midlight, QColor.lighter, 125),
+        (QPalette.Mid, QColor.darker, 125),
+        (QPalette.Dark, QColor.darker, 150),
+        (QPalette.Shadow, QColor.darker, 200),
+    )
+    
+    # Semantic colors taken from the Colors:View section, as (KDE key, semantic name)
+    _SEMANTIC_MAP = (
+        ("ForegroundPositive", "success"),
+        ("ForegroundNegative", "error"),
+        ("ForegroundNeutral", "warning"),
+        ("ForegroundLink", "info"),
+        # Active (could be used for critical/accent)
+        ("ForegroundActive", "critical"),
+    )
+    
+    # Preview colors reported by get_scheme_info(), as section -> ((preview key, KDE key), ...)
+    _PREVIEW_SPEC = (
+        ("Colors:Window", (("window_bg", "BackgroundNormal"), ("window_fg", "ForegroundNormal"))),
+        ("Colors:View", (
+            ("view_bg", "BackgroundNormal"),
+            ("view_fg", "ForegroundNormal"),
+            ("link", "ForegroundLink"),
+            ("positive", "ForegroundPositive"),
+            ("negative", "ForegroundNegative"),
+            ("neutral", "ForegroundNeutral"),
+        )),
+        ("Colors:Selection", (("selection_bg", "BackgroundNormal"), ("selection_fg", "ForegroundNormal"))),
+        ("Colors:Button", (("button_bg", "BackgroundNormal"), ("button_fg", "ForegroundNormal"))),
+    )
+    
+    @classmethod
+    def _scheme_dirs(cls) -> List[Path]:
+        """Get the color scheme search directories, building the default list on first use"""
+        if cls._SCHEME_DIRS is None:
+            cls._SCHEME_DIRS = [
+                Path.home() / ".local/share/color-schemes",
+                Path("/usr/share/color-schemes"),
+                Path("/usr/local/share/color-schemes"),
+            ]
+        return cls._SCHEME_DIRS
+    
+    @classmethod
+    def _scheme_file_paths(cls) -> Iterator[Path]:
+        """Yield the path of each scheme file, in search order"""
+        for scheme_dir in cls._scheme_dirs():
+            try:
+                entries = list(os.scandir(scheme_dir))
+            except OSError:
+                continue
+            
+            for entry in entries:
+                if entry.name.endswith(".colors") and entry.is_file():
+                    yield Path(entry.path)
+    
+    @staticmethod
+    def _scheme_name(parsed: Optional[Dict[str, Dict[str, str]]]) -> Optional[str]:
+        """Get the internal name of a parsed scheme, if it has one"""
+        return parsed.get("General", {}).get("Name") if parsed else None
+    
+    @classmethod
+    def _iter_scheme_files(cls) -> Iterator[Tuple[Path, Optional[str]]]:
+        """Yield (path, internal name or None) for each scheme file, in search order"""
+        for path in cls._scheme_file_paths():
+            yield path, cls._scheme_name(cls._parse_scheme_file(path))
+    
+    @classmethod
+    def _build_scheme_index(cls) -> Dict[str, Path]:
+        """Scan the scheme directories once, parsing each scheme file for its name"""
+        index = {}
+        names = set()
+        
+        paths = list(cls._scheme_file_paths())
+        if len(paths) >= cls._PARALLEL_PARSE_MIN:
+            # Overlap the file reads; worth it on cold caches and network homes
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+                parsed_files = list(executor.map(cls._parse_scheme_file, paths))
+        else:
+            parsed_files = [cls._parse_scheme_file(path) for path in paths]
+        
+        # Names and index keys are interned; they are compared on every lookup
+        for path, parsed in zip(paths, parsed_files):
+            name = cls._scheme_name(parsed)
+            # Use the internal name, or the filename without extension
+            names.add(sys.intern(name or path.stem))
+            
+            # The first file found wins for both its filename and its name
+            index.setdefault(sys.intern(path.stem.lower()), path)
+            if name:
+                index.setdefault(sys.intern(name.lower()), path)
+        
+        cls._scheme_index = index
+        cls._scheme_names = sorted(names)
+        return index
+    
+    @classmethod
+    def refresh_schemes(cls):
+        """
+        Rescan the scheme directories on the next lookup.
+        
+        Call this after installing or removing color schemes while the
+        application is running.
+        """
+        cls._scheme_index = None
+    
+    @classmethod
+    def iter_schemes(cls) -> Iterator[str]:
+        """
+        Iterate over installed KDE color scheme names.
+        
+        Unlike list_schemes(), names are produced as the scheme files are
+        found (unsorted) when no scan has happened yet, so callers that stop
+        early (membership checks, autocompletion) do not wait for a full scan.
+        
+        Yields:
+            Color scheme names, each once
+        """
+        if cls._scheme_index is not None:
+            yield from list(cls._scheme_names)
+            return
+        
+        seen = set()
+        for path, name in cls._iter_scheme_files():
+            display_name = name or path.stem
+            if display_name not in seen:
+                seen.add(display_name)
+                yield display_name
+    
     @classmethod
     def list_schemes(cls) -> List[str]:
         """
@@ -865,21 +1258,9 @@ class KDEColorScheme:
         Returns:
             List of color scheme names
         """
-        schemes = []
-        
-        for scheme_dir in cls._SCHEME_DIRS:
-            if scheme_dir.exists() and scheme_dir.is_dir():
-                for item in scheme_dir.iterdir():
-                    if item.is_file() and item.suffix == ".colors":
-                        # Parse to get the actual name
-                        parsed = cls._parse_scheme_file(item)
-                        if parsed and "General" in parsed and "Name" in parsed["General"]:
-                            schemes.append(parsed["General"]["Name"])
-                        else:
-                            # Use filename without extension
-                            schemes.append(item.stem)
-        
-        return sorted(set(schemes))
+        if cls._scheme_index is None:
+            cls._build_scheme_index()
+        return list(cls._scheme_names)
     
     @classmethod
     def get_scheme_path(cls, name: str) -> Optional[Path]:
@@ -892,19 +1273,10 @@ class KDEColorScheme:
         Returns:
             Path to the scheme file or None if not found
         """
-        for scheme_dir in cls._SCHEME_DIRS:
-            if scheme_dir.exists():
-                for item in scheme_dir.iterdir():
-                    if item.is_file() and item.suffix == ".colors":
-                        # Check by filename
-                        if item.stem.lower() == name.lower():
-                            return item
-                        # Check by internal name
-                        parsed = cls._parse_scheme_file(item)
-                        if parsed and "General" in parsed:
-                            if parsed["General"].get("Name", "").lower() == name.lower():
-                                return item
-        return None
+        index = cls._scheme_index
+        if index is None:
+            index = cls._build_scheme_index()
+        return index.get(name.lower())
     
     @classmethod
     def _parse_scheme_file(cls, path: Path) -> Optional[Dict[str, Dict[str, str]]]:
@@ -917,40 +1289,49 @@ class KDEColorScheme:
         Returns:
             Dictionary with sections and their key-value pairs
         """
-        if not path.exists():
+        try:
+            st = path.stat()
+        except OSError:
             return None
         
-        # Check cache
+        # Check cache, reparsing files modified since they were cached
         cache_key = str(path)
-        if cache_key in cls._scheme_cache:
-            return cls._scheme_cache[cache_key]
-        
-        result = {}
-        current_section = None
+        cached = cls._scheme_cache.get(cache_key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
         
+        # Read in one call; newlines are already normalized to "\n", and stray
+        # non-UTF-8 bytes (e.g. in a comment) must not lose the whole scheme
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # Section header
-                    if line.startswith('[') and line.endswith(']'):
-                        current_section = line[1:-1]
-                        if current_section not in result:
-                            result[current_section] = {}
-                    elif '=' in line and current_section:
-                        key, _, value = line.partition('=')
-                        result[current_section][key.strip()] = value.strip()
-            
-            cls._scheme_cache[cache_key] = result
-            return result
-            
-        except Exception as e:
+            text = path.read_text(encoding='utf-8', errors='replace')
+        except OSError as e:
             print(f"Error parsing color scheme {path}: {e}")
             return None
+        
+        result = {}
+        # Key/value dict of the current section, None before the first named one
+        section = None
+        
+        for line in text.split('\n'):
+            line = line.strip()
+            
+            if not line or line[0] == '#':
+                continue
+            
+            # Section header
+            if line[0] == '[' and line[-1] == ']':
+                current_section = line[1:-1]
+                section = result.setdefault(current_section, {}) if current_section else None
+            elif section is not None and '=' in line:
+                key, _, value = line.partition('=')
+                section[key.strip()] = value.strip()
+        
+        with cls._scheme_cache_lock:
+            cls._scheme_cache.pop(cache_key, None)
+            if len(cls._scheme_cache) >= cls._SCHEME_CACHE_SIZE:
+                del cls._scheme_cache[next(iter(cls._scheme_cache))]
+            cls._scheme_cache[cache_key] = (st.st_mtime_ns, st.st_size, result)
+        return result
     
     @classmethod
     def get_scheme_colors(cls, name: str) -> Optional[Dict[str, Dict[str, str]]]:
@@ -979,15 +1360,26 @@ class KDEColorScheme:
         Returns:
             QColor object or None if invalid
         """
-        try:
-            parts = [int(p.strip()) for p in color_str.split(',')]
-            if len(parts) == 3:
-                return QColor(parts[0], parts[1], parts[2])
-            elif len(parts) == 4:
-                return QColor(parts[0], parts[1], parts[2], parts[3])
-        except (ValueError, IndexError):
-            pass
-        return None
+        # Parsing is memoized; each caller still gets its own QColor
+        parts = _parse_kde_components(color_str)
+        if parts is None:
+            return None
+        return QColor(*parts)
+    
+    @classmethod
+    def _parse_color_hex(cls, color_str: str) -> Optional[str]:
+        """
+        Parse a KDE color string (R,G,B or R,G,B,A) to a "#rrggbb" name.
+        
+        For stylesheets and other string uses; skips building a QColor.
+        
+        Args:
+            color_str: Color string like "255,255,255" or "255,255,255,128"
+        
+        Returns:
+            Hex color string or None if invalid
+        """
+        return _kde_color_hex(color_str)
     
     @classmethod
     def is_scheme_dark(cls, name: str) -> bool:
@@ -1006,6 +1398,11 @@ class KDEColorScheme:
         if not colors:
             return False
         
+        return cls._compute_is_dark(colors)
+    
+    @classmethod
+    def _compute_is_dark(cls, colors: Dict[str, Dict[str, str]]) -> bool:
+        """Determine darkness from already parsed scheme data"""
         # Check Window or View background
         bg_str = None
         if "Colors:Window" in colors:
@@ -1014,10 +1411,15 @@ class KDEColorScheme:
             bg_str = colors["Colors:View"].get("BackgroundNormal")
         
         if bg_str:
-            color = cls._parse_color(bg_str)
-            if color:
-                luminance = LookAndFeel.get_luminance(color)
-                return luminance < 0.5
+            parts = _parse_kde_components(bg_str)
+            if parts:
+                # Straight from the memoized components; out of range values
+                # still go through QColor, which treats them as invalid
+                if all(0 <= p <= 255 for p in parts):
+                    rgb = (parts[0] << 16) | (parts[1] << 8) | parts[2]
+                else:
+                    rgb = QColor(*parts).rgb() & 0xFFFFFF
+                return _rgb_luminance(rgb) < 0.5
         
         return False
     
@@ -1048,7 +1450,7 @@ class KDEColorScheme:
         if not colors:
             return False
         
-        app = QApplication.instance()
+        app = _get_app()
         if not app:
             return False
         
@@ -1058,13 +1460,22 @@ class KDEColorScheme:
         
         palette = QPalette()
         
+        # Collect every palette.setColor() argument tuple first, then apply in one pass
+        ops = []
+        
         # Apply mapped colors
-        for (section, key), roles in cls._KDE_TO_QPALETTE.items():
-            if section in colors and key in colors[section]:
-                color = cls._parse_color(colors[section][key])
+        for section, entries in cls._KDE_TO_QPALETTE_BY_SECTION.items():
+            section_colors = colors.get(section)
+            if not section_colors:
+                continue
+            for key, roles in entries:
+                value = section_colors.get(key)
+                if value is None:
+                    continue
+                color = cls._parse_color(value)
                 if color:
                     for role in roles:
-                        palette.setColor(role, color)
+                        ops.append((role, color))
         
         # Additional derived colors
         if "Colors:View" in colors:
@@ -1074,18 +1485,14 @@ class KDEColorScheme:
             if "ForegroundActive" in view:
                 color = cls._parse_color(view["ForegroundActive"])
                 if color:
-                    palette.setColor(QPalette.BrightText, color)
+                    ops.append((QPalette.BrightText, color))
         
         # Set light/mid/dark from Window colors
         if "Colors:Window" in colors:
             window = colors["Colors:Window"]
             bg = cls._parse_color(window.get("BackgroundNormal", "255,255,255"))
             if bg:
-                palette.setColor(QPalette.Light, bg.lighter(150))
-                palette.setColor(QPalette.Midlight, bg.lighter(125))
-                palette.setColor(QPalette.Mid, bg.darker(125))
-                palette.setColor(QPalette.Dark, bg.darker(150))
-                palette.setColor(QPalette.Shadow, bg.darker(200))
+                ops.extend((role, shade(bg, factor)) for role, shade, factor in cls._WINDOW_SHADES)
         
         # Apply disabled state colors
         if "ColorEffects:Disabled" in colors:
@@ -1094,15 +1501,17 @@ class KDEColorScheme:
             disabled_color = cls._parse_color(disabled_color_str)
             if disabled_color:
                 # Disabled text
-                palette.setColor(QPalette.Disabled, QPalette.WindowText, disabled_color)
-                palette.setColor(QPalette.Disabled, QPalette.Text, disabled_color)
-                palette.setColor(QPalette.Disabled, QPalette.ButtonText, disabled_color)
+                ops.extend((QPalette.Disabled, role, disabled_color)
+                           for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText))
+        
+        for op in ops:
+            palette.setColor(*op)
         
         app.setPalette(palette)
         cls._current_scheme = name
         
         # Update LookAndFeel forced scheme based on darkness
-        if cls.is_scheme_dark(name):
+        if cls._compute_is_dark(colors):
             LookAndFeel._forced_scheme = ColorScheme.DARK
         else:
             LookAndFeel._forced_scheme = ColorScheme.LIGHT
@@ -1111,7 +1520,7 @@ class KDEColorScheme:
         LookAndFeel.apply_palette_stylesheet()
         
         # Refresh all widgets
-        LookAndFeel.refresh_widgets()
+        LookAndFeel._schedule_refresh()
         
         return True
     
@@ -1120,7 +1529,7 @@ class KDEColorScheme:
         """
         Reset to the original system palette.
         """
-        app = QApplication.instance()
+        app = _get_app()
         if app and LookAndFeel._original_palette:
             app.setPalette(LookAndFeel._original_palette)
             # Clear stylesheet
@@ -1130,7 +1539,7 @@ class KDEColorScheme:
         LookAndFeel._forced_scheme = None
         
         # Refresh widgets
-        LookAndFeel.refresh_widgets()
+        LookAndFeel._schedule_refresh()
     
     @classmethod
     def get_scheme_info(cls, name: str) -> Dict[str, any]:
@@ -1143,51 +1552,43 @@ class KDEColorScheme:
         Returns:
             Dictionary with scheme metadata and preview colors
         """
-        colors = cls.get_scheme_colors(name)
+        # Look the scheme up and parse it once for all fields
+        path = cls.get_scheme_path(name)
+        colors = cls._parse_scheme_file(path) if path else None
         if not colors:
             return {}
         
+        # A reparsed or re-resolved scheme is a new dict, so identity covers staleness
+        cached = cls._info_cache.get(name)
+        if cached is not None and cached[0] is colors:
+            info = cached[1]
+            return {**info, "preview": dict(info["preview"])}
+        
         info = {
             "name": name,
-            "is_dark": cls.is_scheme_dark(name),
-            "path": str(cls.get_scheme_path(name)),
+            "is_dark": cls._compute_is_dark(colors),
+            "path": str(path),
         }
         
-        # Extract preview colors
-        preview = {}
-        
-        if "Colors:Window" in colors:
-            w = colors["Colors:Window"]
-            preview["window_bg"] = w.get("BackgroundNormal")
-            preview["window_fg"] = w.get("ForegroundNormal")
-        
-        if "Colors:View" in colors:
-            v = colors["Colors:View"]
-            preview["view_bg"] = v.get("BackgroundNormal")
-            preview["view_fg"] = v.get("ForegroundNormal")
-            preview["link"] = v.get("ForegroundLink")
-            preview["positive"] = v.get("ForegroundPositive")
-            preview["negative"] = v.get("ForegroundNegative")
-            preview["neutral"] = v.get("ForegroundNeutral")
-        
-        if "Colors:Selection" in colors:
-            s = colors["Colors:Selection"]
-            preview["selection_bg"] = s.get("BackgroundNormal")
-            preview["selection_fg"] = s.get("ForegroundNormal")
-        
-        if "Colors:Button" in colors:
-            b = colors["Colors:Button"]
-            preview["button_bg"] = b.get("BackgroundNormal")
-            preview["button_fg"] = b.get("ForegroundNormal")
-        
-        info["preview"] = preview
+        # Extract preview colors; keys of a present section are reported even if unset
+        info["preview"] = {
+            preview_key: colors[section].get(scheme_key)
+            for section, specs in cls._PREVIEW_SPEC if section in colors
+            for preview_key, scheme_key in specs
+        }
         
         # General info
         if "General" in colors:
             info["display_name"] = colors["General"].get("Name", name)
             info["color_scheme_id"] = colors["General"].get("ColorScheme")
         
-        return info
+        with cls._scheme_cache_lock:
+            cls._info_cache.pop(name, None)
+            if len(cls._info_cache) >= cls._SCHEME_CACHE_SIZE:
+                del cls._info_cache[next(iter(cls._info_cache))]
+            cls._info_cache[name] = (colors, info)
+        
+        return {**info, "preview": dict(info["preview"])}
     
     @classmethod
     def get_semantic_colors_from_scheme(cls, name: str) -> Dict[str, str]:
@@ -1212,40 +1613,14 @@ class KDEColorScheme:
         # Extract from View colors (most complete)
         view = colors.get("Colors:View", {})
         
-        # Success (Positive)
-        if "ForegroundPositive" in view:
-            color = cls._parse_color(view["ForegroundPositive"])
-            if color:
-                semantic["success"] = color.name()
-                semantic["success_text"] = LookAndFeel.get_contrasting_color(color)
-        
-        # Error (Negative)
-        if "ForegroundNegative" in view:
-            color = cls._parse_color(view["ForegroundNegative"])
-            if color:
-                semantic["error"] = color.name()
-                semantic["error_text"] = LookAndFeel.get_contrasting_color(color)
-        
-        # Warning (Neutral)
-        if "ForegroundNeutral" in view:
-            color = cls._parse_color(view["ForegroundNeutral"])
-            if color:
-                semantic["warning"] = color.name()
-                semantic["warning_text"] = LookAndFeel.get_contrasting_color(color)
-        
-        # Info (Link)
-        if "ForegroundLink" in view:
-            color = cls._parse_color(view["ForegroundLink"])
-            if color:
-                semantic["info"] = color.name()
-                semantic["info_text"] = LookAndFeel.get_contrasting_color(color)
-        
-        # Active (could be used for critical/accent)
-        if "ForegroundActive" in view:
-            color = cls._parse_color(view["ForegroundActive"])
-            if color:
-                semantic["critical"] = color.name()
-                semantic["critical_text"] = LookAndFeel.get_contrasting_color(color)
+        for view_key, sem_type in cls._SEMANTIC_MAP:
+            value = view.get(view_key)
+            if not value:
+                continue
+            name = cls._parse_color_hex(value)
+            if name:
+                semantic[sem_type] = name
+                semantic[f"{sem_type}_text"] = LookAndFeel.get_contrasting_color(name)
         
         return semantic
     
@@ -1258,9 +1633,154 @@ class KDEColorScheme:
             path: Directory path containing .colors files
         """
         p = Path(path)
-        if p.exists() and p.is_dir() and p not in cls._SCHEME_DIRS:
-            cls._SCHEME_DIRS.append(p)
-            cls._scheme_cache.clear()  # Clear cache to pick up new schemes
+        scheme_dirs = cls._scheme_dirs()
+        if p.exists() and p.is_dir() and p not in scheme_dirs:
+            scheme_dirs.append(p)
+            cls._scheme_index = None  # Rescan to pick up new schemes
+
+
+# Standard freedesktop.org icon names by category, for IconTheme.list_standard_icons()
+_STANDARD_ICONS: Dict[str, Tuple[str, ...]] = {
+    "actions": (
+        "document-new", "document-open", "document-open-recent",
+        "document-save", "document-save-as", "document-save-all",
+        "document-close", "document-print", "document-print-preview",
+        "document-properties", "document-revert",
+        "edit-copy", "edit-cut", "edit-paste", "edit-delete",
+        "edit-undo", "edit-redo", "edit-select-all", "edit-clear",
+        "edit-find", "edit-find-replace",
+        "view-refresh", "view-fullscreen", "view-restore",
+        "view-sort-ascending", "view-sort-descending",
+        "go-home", "go-up", "go-down", "go-previous", "go-next",
+        "go-first", "go-last", "go-jump",
+        "list-add", "list-remove",
+        "format-text-bold", "format-text-italic", "format-text-underline",
+        "format-indent-more", "format-indent-less",
+        "format-justify-left", "format-justify-center",
+        "format-justify-right", "format-justify-fill",
+        "window-close", "window-new",
+        "application-exit",
+        "help-about", "help-contents", "help-faq",
+        "system-search", "system-run", "system-shutdown",
+        "system-lock-screen", "system-log-out",
+        "zoom-in", "zoom-out", "zoom-fit-best", "zoom-original",
+        "media-playback-start", "media-playback-pause",
+        "media-playback-stop", "media-record",
+        "media-seek-backward", "media-seek-forward",
+        "media-skip-backward", "media-skip-forward",
+        "media-eject",
+        "process-stop", "call-start", "call-stop",
+        "bookmark-new", "contact-new", "mail-send",
+    ),
+    "apps": (
+        "accessories-calculator", "accessories-text-editor",
+        "help-browser", "multimedia-volume-control",
+        "preferences-desktop", "preferences-system",
+        "system-file-manager", "system-software-install",
+        "utilities-terminal", "utilities-system-monitor",
+    ),
+    "categories": (
+        "applications-accessories", "applications-development",
+        "applications-games", "applications-graphics",
+        "applications-internet", "applications-multimedia",
+        "applications-office", "applications-system",
+        "applications-utilities", "preferences-desktop",
+        "preferences-system",
+    ),
+    "devices": (
+        "audio-card", "audio-input-microphone",
+        "battery", "camera-photo", "camera-video",
+        "computer", "drive-harddisk", "drive-optical",
+        "drive-removable-media", "input-keyboard",
+        "input-mouse", "media-flash", "media-optical",
+        "multimedia-player", "network-wired", "network-wireless",
+        "phone", "printer", "scanner", "video-display",
+    ),
+    "emblems": (
+        "emblem-default", "emblem-documents", "emblem-downloads",
+        "emblem-favorite", "emblem-important", "emblem-mail",
+        "emblem-photos", "emblem-readonly", "emblem-shared",
+        "emblem-symbolic-link", "emblem-synchronized",
+        "emblem-system", "emblem-unreadable",
+    ),
+    "mimetypes": (
+        "application-x-executable", "audio-x-generic",
+        "font-x-generic", "image-x-generic",
+        "package-x-generic", "text-html", "text-x-generic",
+        "text-x-script", "video-x-generic",
+        "x-office-address-book", "x-office-calendar",
+        "x-office-document", "x-office-presentation",
+        "x-office-spreadsheet",
+    ),
+    "places": (
+        "folder", "folder-documents", "folder-download",
+        "folder-music", "folder-pictures", "folder-remote",
+        "folder-saved-search", "folder-templates",
+        "folder-videos", "network-server", "network-workgroup",
+        "start-here", "user-bookmarks", "user-desktop",
+        "user-home", "user-trash",
+    ),
+    "status": (
+        "appointment-missed", "appointment-soon",
+        "audio-volume-high", "audio-volume-low",
+        "audio-volume-medium", "audio-volume-muted",
+        "battery-caution", "battery-low",
+        "dialog-error", "dialog-information",
+        "dialog-password", "dialog-question", "dialog-warning",
+        "folder-drag-accept", "folder-open", "folder-visiting",
+        "image-loading", "image-missing",
+        "mail-attachment", "mail-read", "mail-unread",
+        "network-error", "network-idle", "network-offline",
+        "network-receive", "network-transmit",
+        "network-transmit-receive",
+        "printer-error", "printer-printing",
+        "security-high", "security-medium", "security-low",
+        "software-update-available", "software-update-urgent",
+        "task-due", "task-past-due",
+        "user-available", "user-away", "user-idle", "user-offline",
+        "weather-clear", "weather-few-clouds", "weather-overcast",
+        "weather-showers", "weather-snow", "weather-storm",
+    ),
+}
+# Hyphenated names are not interned by the compiler; intern them so lookups
+# with the same names elsewhere compare by identity
+_STANDARD_ICONS = {
+    sys.intern(category): tuple(map(sys.intern, names))
+    for category, names in _STANDARD_ICONS.items()
+}
+# The same names as sets, for IconTheme.is_standard_icon()
+_STANDARD_ICON_SETS: Dict[str, frozenset] = {
+    category: frozenset(names) for category, names in _STANDARD_ICONS.items()
+}
+_ALL_STANDARD_ICONS = frozenset().union(*_STANDARD_ICON_SETS.values())
+
+
+# Qt standard icon names, for IconTheme.list_qt_standard_icons()
+_QT_STANDARD_ICON_NAMES = (
+    "SP_TitleBarMenuButton", "SP_TitleBarMinButton", "SP_TitleBarMaxButton",
+    "SP_TitleBarCloseButton", "SP_TitleBarNormalButton", "SP_TitleBarShadeButton",
+    "SP_TitleBarUnshadeButton", "SP_TitleBarContextHelpButton", "SP_DockWidgetCloseButton",
+    "SP_MessageBoxInformation", "SP_MessageBoxWarning", "SP_MessageBoxCritical",
+    "SP_MessageBoxQuestion", "SP_DesktopIcon", "SP_TrashIcon", "SP_ComputerIcon",
+    "SP_DriveFDIcon", "SP_DriveHDIcon", "SP_DriveCDIcon", "SP_DriveDVDIcon", "SP_DriveNetIcon",
+    "SP_DirOpenIcon", "SP_DirClosedIcon", "SP_DirLinkIcon", "SP_DirLinkOpenIcon", "SP_FileIcon",
+    "SP_FileLinkIcon", "SP_FileDialogStart", "SP_FileDialogEnd", "SP_FileDialogToParent",
+    "SP_FileDialogNewFolder", "SP_FileDialogDetailedView", "SP_FileDialogInfoView",
+    "SP_FileDialogContentsView", "SP_FileDialogListView", "SP_FileDialogBack", "SP_DirIcon",
+    "SP_DialogOkButton", "SP_DialogCancelButton", "SP_DialogHelpButton", "SP_DialogOpenButton",
+    "SP_DialogSaveButton", "SP_DialogCloseButton", "SP_DialogApplyButton",
+    "SP_DialogResetButton", "SP_DialogDiscardButton", "SP_DialogYesButton", "SP_DialogNoButton",
+    "SP_ArrowUp", "SP_ArrowDown", "SP_ArrowLeft", "SP_ArrowRight", "SP_ArrowBack",
+    "SP_ArrowForward", "SP_DirHomeIcon", "SP_CommandLink", "SP_VistaShield", "SP_BrowserReload",
+    "SP_BrowserStop", "SP_MediaPlay", "SP_MediaStop", "SP_MediaPause", "SP_MediaSkipForward",
+    "SP_MediaSkipBackward", "SP_MediaSeekForward", "SP_MediaSeekBackward", "SP_MediaVolume",
+    "SP_MediaVolumeMuted", "SP_LineEditClearButton", "SP_RestoreDefaultsButton",
+)
+# Resolved in a single attrgetter call rather than one getattr per name
+_QT_STANDARD_ICONS: Dict[str, QStyle.StandardPixmap] = dict(
+    zip(_QT_STANDARD_ICON_NAMES, attrgetter(*_QT_STANDARD_ICON_NAMES)(QStyle))
+)
+_QT_STANDARD_ICON_NAME_SET = frozenset(_QT_STANDARD_ICON_NAMES)
 
 
 class IconTheme:
@@ -1276,6 +1796,19 @@ class IconTheme:
     
     _custom_theme_paths: List[Path] = []
     _custom_theme_name: Optional[str] = None
+    # Qt's theme search paths as last read or set through IconTheme
+    _search_paths: Optional[Tuple[str, ...]] = None
+    
+    # Directory contents and index.theme directory lists seen by get_icon_path(),
+    # cleared when themes or paths change
+    _dir_listing_cache: Dict[str, frozenset] = {}
+    _theme_dirs_cache: Dict[str, Optional[frozenset]] = {}
+    
+    # Resolved icons, oldest dropped first once full. Theme icons are keyed by
+    # (theme, name, fallback, size); standard icons by (style, palette, pixmap).
+    _ICON_CACHE_SIZE = 1024
+    _icon_cache: Dict[tuple, QIcon] = {}
+    _standard_icon_cache: Dict[tuple, QIcon] = {}
     
     # Standard icon theme directories on Linux
     _LINUX_ICON_DIRS = [
@@ -1288,12 +1821,15 @@ class IconTheme:
     
     # Standard icon sizes to search
     _ICON_SIZES = [48, 32, 24, 22, 16, "scalable"]
+    _INT_ICON_SIZES: Tuple[int, ...] = tuple(s for s in _ICON_SIZES if isinstance(s, int))
     
     # Standard icon contexts/categories
     _ICON_CONTEXTS = [
         "actions", "apps", "categories", "devices", "emblems",
         "emotes", "mimetypes", "places", "status", "stock",
     ]
+    # Contexts searched by get_icon_path() when none is given - expanded list
+    _ICON_CONTEXTS_EXT: Tuple[str, ...] = (*_ICON_CONTEXTS, "animations", "intl", "filesystems")
     
     # ==================== Icon Theme Management ====================
     
@@ -1311,15 +1847,17 @@ class IconTheme:
         search_dirs = cls._LINUX_ICON_DIRS + cls._custom_theme_paths
         
         for icon_dir in search_dirs:
-            if icon_dir.exists() and icon_dir.is_dir():
-                for item in icon_dir.iterdir():
-                    if item.is_dir():
-                        # Check if it has an index.theme file (valid icon theme)
-                        index_file = item / "index.theme"
-                        if index_file.exists():
-                            themes.add(item.name)
+            try:
+                entries = list(os.scandir(icon_dir))
+            except OSError:
+                continue
+            
+            for entry in entries:
+                # Check if it has an index.theme file (valid icon theme)
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, "index.theme")):
+                    themes.add(sys.intern(entry.name))
         
-        return sorted(list(themes))
+        return sorted(themes)
     
     @classmethod
     def get_current_theme(cls) -> str:
@@ -1346,8 +1884,16 @@ class IconTheme:
         """
         cls._custom_theme_name = theme_name
         QIcon.setThemeName(theme_name)
+        cls._clear_lookup_caches()
         return True
     
+    @classmethod
+    def _clear_lookup_caches(cls):
+        """Forget cached directory contents and resolved icons"""
+        cls._dir_listing_cache.clear()
+        cls._theme_dirs_cache.clear()
+        cls._icon_cache.clear()
+    
     @classmethod
     def add_theme_search_path(cls, path: str):
         """
@@ -1356,23 +1902,54 @@ class IconTheme:
         Args:
             path: Directory path containing icon themes
         """
-        path_obj = Path(path)
-        if path_obj.exists() and path_obj.is_dir():
-            cls._custom_theme_paths.append(path_obj)
-            # Also add to Qt's search paths
-            QIcon.setThemeSearchPaths(
-                QIcon.themeSearchPaths() + [str(path_obj)]
-            )
+        cls.add_theme_search_paths([path])
+    
+    @classmethod
+    def add_theme_search_paths(cls, paths: List[str]):
+        """
+        Add several custom directories to search for icon themes.
+        
+        Qt's search path list is updated once for all of them, so prefer this
+        over repeated add_theme_search_path() calls (e.g. from a plugin loader).
+        
+        Args:
+            paths: Directory paths containing icon themes
+        """
+        added = []
+        for path in paths:
+            path_obj = Path(path)
+            if path_obj.is_dir() and path_obj not in cls._custom_theme_paths:
+                cls._custom_theme_paths.append(path_obj)
+                added.append(str(path_obj))
+        
+        if not added:
+            return
+        
+        cls._clear_lookup_caches()
+        
+        # Also add to Qt's search paths, skipping ones it already has
+        search_paths = QIcon.themeSearchPaths()
+        new_paths = [p for p in dict.fromkeys(added) if p not in search_paths]
+        if new_paths:
+            search_paths += new_paths
+            QIcon.setThemeSearchPaths(search_paths)
+        cls._search_paths = tuple(search_paths)
     
     @classmethod
     def get_theme_search_paths(cls) -> List[str]:
         """
         Get all icon theme search paths.
         
+        The list is read from Qt once and kept up to date by
+        add_theme_search_paths(); paths changed directly through
+        QIcon.setThemeSearchPaths() afterwards are not picked up.
+        
         Returns:
             List of directory paths
         """
-        return QIcon.themeSearchPaths()
+        if cls._search_paths is None:
+            cls._search_paths = tuple(QIcon.themeSearchPaths())
+        return list(cls._search_paths)
     
     # ==================== Icon Access ====================
     
@@ -1410,6 +1987,20 @@ class IconTheme:
             icon = IconTheme.get_icon("folder", theme="Papirus")
             icon = IconTheme.get_icon("folder", theme="breeze-dark")
         """
+        # Size only matters for file lookups in an explicit theme
+        key = (theme or cls.get_current_theme(), name, fallback, size if theme else None)
+        icon = cls._icon_cache.get(key)
+        if icon is None:
+            icon = cls._lookup_icon(name, fallback, theme, size)
+            if len(cls._icon_cache) >= cls._ICON_CACHE_SIZE:
+                del cls._icon_cache[next(iter(cls._icon_cache))]
+            cls._icon_cache[key] = icon
+        # Callers may modify their icon; hand out a (shallow, shared-data) copy
+        return QIcon(icon)
+    
+    @classmethod
+    def _lookup_icon(cls, name: str, fallback: Optional[str], theme: Optional[str], size: int) -> QIcon:
+        """Resolve an icon for get_icon(), bypassing the cache"""
         if theme:
             # Use get_icon_path to find icon in specific theme (no global state change)
             path = cls.get_icon_path(name, size=size, theme=theme)
@@ -1462,50 +2053,28 @@ class IconTheme:
         # Extensions to try (prefer svg)
         extensions = [".svg", ".png", ".xpm"]
         
-        # Sizes to try (starting with requested size)
-        int_sizes = [s for s in cls._ICON_SIZES if isinstance(s, int)]
-        sizes_to_try = [size] + [s for s in int_sizes if s != size] + ["scalable"]
-        
-        # Contexts to try - expanded list
-        contexts_to_try = [context] if context else [
-            "actions", "apps", "categories", "devices", "emblems",
-            "emotes", "mimetypes", "places", "status", "stock",
-            "animations", "intl", "filesystems"
-        ]
+        file_names = [f"{name}{ext}" for ext in extensions]
+        search_groups = cls._icon_search_dirs(size, context)
+        list_dir = cls._list_dir
         
         def search_in_theme(theme_dir: Path) -> Optional[str]:
             """Search for icon in a theme directory"""
-            if not theme_dir.exists():
+            theme_path = str(theme_dir)
+            if not list_dir(theme_path):
                 return None
             
-            for sz in sizes_to_try:
-                for ctx in contexts_to_try:
-                    if ctx is None:
-                        continue
-                    
-                    for ext in extensions:
-                        # Structure 1: {context}/{size}/{name}.ext (Breeze, Papirus)
-                        if isinstance(sz, int):
-                            icon_path = theme_dir / ctx / str(sz) / f"{name}{ext}"
-                            if icon_path.exists():
-                                return str(icon_path)
-                        
-                        # Structure 2: {size}x{size}/{context}/{name}.ext (hicolor, some themes)
-                        size_dir = f"{sz}x{sz}" if isinstance(sz, int) else sz
-                        icon_path = theme_dir / size_dir / ctx / f"{name}{ext}"
-                        if icon_path.exists():
-                            return str(icon_path)
-                        
-                        # Structure 3: {context}/{size}x{size}/{name}.ext
-                        icon_path = theme_dir / ctx / size_dir / f"{name}{ext}"
-                        if icon_path.exists():
-                            return str(icon_path)
-                        
-                        # Structure 4: scalable/{context}/{name}.ext
-                        if sz == "scalable":
-                            icon_path = theme_dir / "scalable" / ctx / f"{name}{ext}"
-                            if icon_path.exists():
-                                return str(icon_path)
+            # Skip directories the theme's index.theme does not declare
+            declared = cls._theme_directories(theme_path)
+            
+            for group in search_groups:
+                if declared is not None:
+                    group = [rel_dir for rel_dir in group if rel_dir in declared]
+                icon_dirs = [os.path.join(theme_path, rel_dir) for rel_dir in group]
+                listings = [list_dir(icon_dir) for icon_dir in icon_dirs]
+                for file_name in file_names:
+                    for icon_dir, listing in zip(icon_dirs, listings):
+                        if file_name in listing:
+                            return os.path.join(icon_dir, file_name)
             
             return None
         
@@ -1526,6 +2095,92 @@ class IconTheme:
         
         return None
     
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _icon_search_dirs(cls, size: int, context: Optional[str]) -> Tuple[Tuple[str, ...], ...]:
+        """
+        Get the theme-relative directories get_icon_path() searches, in order.
+        
+        Directories are grouped per (size, context); every extension is tried
+        in a group before moving on. A directory is listed only the first
+        time it comes up, since a later repeat cannot find anything new.
+        """
+        # Sizes to try (starting with requested size)
+        sizes_to_try = (size, *(s for s in cls._INT_ICON_SIZES if s != size), "scalable")
+        
+        # Contexts to try
+        contexts_to_try = (context,) if context else cls._ICON_CONTEXTS_EXT
+        
+        seen = set()
+        groups = []
+        for sz in sizes_to_try:
+            size_dir = f"{sz}x{sz}" if isinstance(sz, int) else sz
+            for ctx in contexts_to_try:
+                rel_dirs = []
+                # Structure 1: {context}/{size}/{name}.ext (Breeze, Papirus)
+                if isinstance(sz, int):
+                    rel_dirs.append(os.path.join(ctx, str(sz)))
+                # Structure 2: {size}x{size}/{context}/{name}.ext (hicolor, some themes)
+                rel_dirs.append(os.path.join(size_dir, ctx))
+                # Structure 3: {context}/{size}x{size}/{name}.ext
+                rel_dirs.append(os.path.join(ctx, size_dir))
+                # Structure 4: scalable/{context}/{name}.ext
+                if sz == "scalable":
+                    rel_dirs.append(os.path.join("scalable", ctx))
+                
+                group = tuple(d for d in dict.fromkeys(rel_dirs) if d not in seen)
+                seen.update(group)
+                if group:
+                    groups.append(group)
+        
+        return tuple(groups)
+    
+    @classmethod
+    def _theme_directories(cls, theme_path: str) -> Optional[frozenset]:
+        """
+        Get the icon directories declared in a theme's index.theme.
+        
+        Returns:
+            Relative directory paths, or None if the theme has no index.theme
+            or it does not list its directories
+        """
+        if theme_path in cls._theme_dirs_cache:
+            return cls._theme_dirs_cache[theme_path]
+        
+        declared = None
+        try:
+            with open(os.path.join(theme_path, "index.theme"), encoding="utf-8", errors="replace") as f:
+                in_header = False
+                for line in f:
+                    line = line.strip()
+                    if line.startswith('['):
+                        # Only the [Icon Theme] header is needed; stop once past it
+                        if in_header:
+                            break
+                        in_header = line == "[Icon Theme]"
+                    elif in_header and '=' in line:
+                        key, _, value = line.partition('=')
+                        if key.strip() in ("Directories", "ScaledDirectories"):
+                            dirs = {os.path.normpath(d.strip()) for d in value.split(',') if d.strip()}
+                            declared = (declared or frozenset()) | dirs
+        except OSError:
+            pass
+        
+        cls._theme_dirs_cache[theme_path] = declared
+        return declared
+    
+    @classmethod
+    def _list_dir(cls, path: str) -> frozenset:
+        """Get the cached entry names of a directory, empty if it cannot be read"""
+        listing = cls._dir_listing_cache.get(path)
+        if listing is None:
+            try:
+                listing = frozenset(os.listdir(path))
+            except OSError:
+                listing = frozenset()
+            cls._dir_listing_cache[path] = listing
+        return listing
+    
     @classmethod
     def get_icon_from_file(cls, path: str) -> QIcon:
         """
@@ -1547,6 +2202,7 @@ class IconTheme:
         Args:
             name: Icon name
             theme: Optional icon theme to check. If not provided, uses current theme.
+                   If provided, uses get_icon_path() to look for the icon file directly.
         
         Returns:
             True if icon exists
@@ -1559,11 +2215,8 @@ class IconTheme:
             exists = IconTheme.has_icon("folder", theme="Papirus")
         """
         if theme:
-            original_theme = QIcon.themeName()
-            QIcon.setThemeName(theme)
-            result = QIcon.hasThemeIcon(name)
-            QIcon.setThemeName(original_theme)
-            return result
+            # Filesystem lookup, no global theme switch (same as get_icon)
+            return cls.get_icon_path(name, theme=theme) is not None
         else:
             return QIcon.hasThemeIcon(name)
     
@@ -1575,108 +2228,24 @@ class IconTheme:
         Returns:
             Dictionary with categories as keys and icon name lists as values
         """
-        return {
-            "actions": [
-                "document-new", "document-open", "document-open-recent",
-                "document-save", "document-save-as", "document-save-all",
-                "document-close", "document-print", "document-print-preview",
-                "document-properties", "document-revert",
-                "edit-copy", "edit-cut", "edit-paste", "edit-delete",
-                "edit-undo", "edit-redo", "edit-select-all", "edit-clear",
-                "edit-find", "edit-find-replace",
-                "view-refresh", "view-fullscreen", "view-restore",
-                "view-sort-ascending", "view-sort-descending",
-                "go-home", "go-up", "go-down", "go-previous", "go-next",
-                "go-first", "go-last", "go-jump",
-                "list-add", "list-remove",
-                "format-text-bold", "format-text-italic", "format-text-underline",
-                "format-indent-more", "format-indent-less",
-                "format-justify-left", "format-justify-center",
-                "format-justify-right", "format-justify-fill",
-                "window-close", "window-new",
-                "application-exit",
-                "help-about", "help-contents", "help-faq",
-                "system-search", "system-run", "system-shutdown",
-                "system-lock-screen", "system-log-out",
-                "zoom-in", "zoom-out", "zoom-fit-best", "zoom-original",
-                "media-playback-start", "media-playback-pause",
-                "media-playback-stop", "media-record",
-                "media-seek-backward", "media-seek-forward",
-                "media-skip-backward", "media-skip-forward",
-                "media-eject",
-                "process-stop", "call-start", "call-stop",
-                "bookmark-new", "contact-new", "mail-send",
-            ],
-            "apps": [
-                "accessories-calculator", "accessories-text-editor",
-                "help-browser", "multimedia-volume-control",
-                "preferences-desktop", "preferences-system",
-                "system-file-manager", "system-software-install",
-                "utilities-terminal", "utilities-system-monitor",
-            ],
-            "categories": [
-                "applications-accessories", "applications-development",
-                "applications-games", "applications-graphics",
-                "applications-internet", "applications-multimedia",
-                "applications-office", "applications-system",
-                "applications-utilities", "preferences-desktop",
-                "preferences-system",
-            ],
-            "devices": [
-                "audio-card", "audio-input-microphone",
-                "battery", "camera-photo", "camera-video",
-                "computer", "drive-harddisk", "drive-optical",
-                "drive-removable-media", "input-keyboard",
-                "input-mouse", "media-flash", "media-optical",
-                "multimedia-player", "network-wired", "network-wireless",
-                "phone", "printer", "scanner", "video-display",
-            ],
-            "emblems": [
-                "emblem-default", "emblem-documents", "emblem-downloads",
-                "emblem-favorite", "emblem-important", "emblem-mail",
-                "emblem-photos", "emblem-readonly", "emblem-shared",
-                "emblem-symbolic-link", "emblem-synchronized",
-                "emblem-system", "emblem-unreadable",
-            ],
-            "mimetypes": [
-                "application-x-executable", "audio-x-generic",
-                "font-x-generic", "image-x-generic",
-                "package-x-generic", "text-html", "text-x-generic",
-                "text-x-script", "video-x-generic",
-                "x-office-address-book", "x-office-calendar",
-                "x-office-document", "x-office-presentation",
-                "x-office-spreadsheet",
-            ],
-            "places": [
-                "folder", "folder-documents", "folder-download",
-                "folder-music", "folder-pictures", "folder-remote",
-                "folder-saved-search", "folder-templates",
-                "folder-videos", "network-server", "network-workgroup",
-                "start-here", "user-bookmarks", "user-desktop",
-                "user-home", "user-trash",
-            ],
-            "status": [
-                "appointment-missed", "appointment-soon",
-                "audio-volume-high", "audio-volume-low",
-                "audio-volume-medium", "audio-volume-muted",
-                "battery-caution", "battery-low",
-                "dialog-error", "dialog-information",
-                "dialog-password", "dialog-question", "dialog-warning",
-                "folder-drag-accept", "folder-open", "folder-visiting",
-                "image-loading", "image-missing",
-                "mail-attachment", "mail-read", "mail-unread",
-                "network-error", "network-idle", "network-offline",
-                "network-receive", "network-transmit",
-                "network-transmit-receive",
-                "printer-error", "printer-printing",
-                "security-high", "security-medium", "security-low",
-                "software-update-available", "software-update-urgent",
-                "task-due", "task-past-due",
-                "user-available", "user-away", "user-idle", "user-offline",
-                "weather-clear", "weather-few-clouds", "weather-overcast",
-                "weather-showers", "weather-snow", "weather-storm",
-            ],
-        }
+        # Shared constant; callers get their own lists
+        return {category: list(names) for category, names in _STANDARD_ICONS.items()}
+    
+    @classmethod
+    def is_standard_icon(cls, name: str, category: Optional[str] = None) -> bool:
+        """
+        Check whether a name is a standard freedesktop.org icon name.
+        
+        Args:
+            name: Icon name (e.g., "document-save")
+            category: Optional category to check in (e.g., "actions", "places")
+        
+        Returns:
+            True if the name is listed by list_standard_icons()
+        """
+        if category is None:
+            return name in _ALL_STANDARD_ICONS
+        return name in _STANDARD_ICON_SETS.get(category, ())
     
     @classmethod
     def get_standard_icon(cls, standard_icon: QStyle.StandardPixmap) -> QIcon:
@@ -1692,10 +2261,20 @@ class IconTheme:
         Example:
             icon = IconTheme.get_standard_icon(QStyle.SP_DialogSaveButton)
         """
-        app = QApplication.instance()
-        if app and app.style():
-            return app.style().standardIcon(standard_icon)
-        return QIcon()
+        app = _get_app()
+        style = app.style() if app else None
+        if not style:
+            return QIcon()
+        
+        # Styles may tint their icons with the palette, so it is part of the key
+        key = (style.name(), app.palette().cacheKey(), standard_icon)
+        icon = cls._standard_icon_cache.get(key)
+        if icon is None:
+            icon = style.standardIcon(standard_icon)
+            if len(cls._standard_icon_cache) >= cls._ICON_CACHE_SIZE:
+                del cls._standard_icon_cache[next(iter(cls._standard_icon_cache))]
+            cls._standard_icon_cache[key] = icon
+        return QIcon(icon)
     
     @classmethod
     def list_qt_standard_icons(cls) -> Dict[str, int]:
@@ -1705,78 +2284,21 @@ class IconTheme:
         Returns:
             Dictionary of icon names to QStyle.StandardPixmap values
         """
-        return {
-            "SP_TitleBarMenuButton": QStyle.SP_TitleBarMenuButton,
-            "SP_TitleBarMinButton": QStyle.SP_TitleBarMinButton,
-            "SP_TitleBarMaxButton": QStyle.SP_TitleBarMaxButton,
-            "SP_TitleBarCloseButton": QStyle.SP_TitleBarCloseButton,
-            "SP_TitleBarNormalButton": QStyle.SP_TitleBarNormalButton,
-            "SP_TitleBarShadeButton": QStyle.SP_TitleBarShadeButton,
-            "SP_TitleBarUnshadeButton": QStyle.SP_TitleBarUnshadeButton,
-            "SP_TitleBarContextHelpButton": QStyle.SP_TitleBarContextHelpButton,
-            "SP_DockWidgetCloseButton": QStyle.SP_DockWidgetCloseButton,
-            "SP_MessageBoxInformation": QStyle.SP_MessageBoxInformation,
-            "SP_MessageBoxWarning": QStyle.SP_MessageBoxWarning,
-            "SP_MessageBoxCritical": QStyle.SP_MessageBoxCritical,
-            "SP_MessageBoxQuestion": QStyle.SP_MessageBoxQuestion,
-            "SP_DesktopIcon": QStyle.SP_DesktopIcon,
-            "SP_TrashIcon": QStyle.SP_TrashIcon,
-            "SP_ComputerIcon": QStyle.SP_ComputerIcon,
-            "SP_DriveFDIcon": QStyle.SP_DriveFDIcon,
-            "SP_DriveHDIcon": QStyle.SP_DriveHDIcon,
-            "SP_DriveCDIcon": QStyle.SP_DriveCDIcon,
-            "SP_DriveDVDIcon": QStyle.SP_DriveDVDIcon,
-            "SP_DriveNetIcon": QStyle.SP_DriveNetIcon,
-            "SP_DirOpenIcon": QStyle.SP_DirOpenIcon,
-            "SP_DirClosedIcon": QStyle.SP_DirClosedIcon,
-            "SP_DirLinkIcon": QStyle.SP_DirLinkIcon,
-            "SP_DirLinkOpenIcon": QStyle.SP_DirLinkOpenIcon,
-            "SP_FileIcon": QStyle.SP_FileIcon,
-            "SP_FileLinkIcon": QStyle.SP_FileLinkIcon,
-            "SP_FileDialogStart": QStyle.SP_FileDialogStart,
-            "SP_FileDialogEnd": QStyle.SP_FileDialogEnd,
-            "SP_FileDialogToParent": QStyle.SP_FileDialogToParent,
-            "SP_FileDialogNewFolder": QStyle.SP_FileDialogNewFolder,
-            "SP_FileDialogDetailedView": QStyle.SP_FileDialogDetailedView,
-            "SP_FileDialogInfoView": QStyle.SP_FileDialogInfoView,
-            "SP_FileDialogContentsView": QStyle.SP_FileDialogContentsView,
-            "SP_FileDialogListView": QStyle.SP_FileDialogListView,
-            "SP_FileDialogBack": QStyle.SP_FileDialogBack,
-            "SP_DirIcon": QStyle.SP_DirIcon,
-            "SP_DialogOkButton": QStyle.SP_DialogOkButton,
-            "SP_DialogCancelButton": QStyle.SP_DialogCancelButton,
-            "SP_DialogHelpButton": QStyle.SP_DialogHelpButton,
-            "SP_DialogOpenButton": QStyle.SP_DialogOpenButton,
-            "SP_DialogSaveButton": QStyle.SP_DialogSaveButton,
-            "SP_DialogCloseButton": QStyle.SP_DialogCloseButton,
-            "SP_DialogApplyButton": QStyle.SP_DialogApplyButton,
-            "SP_DialogResetButton": QStyle.SP_DialogResetButton,
-            "SP_DialogDiscardButton": QStyle.SP_DialogDiscardButton,
-            "SP_DialogYesButton": QStyle.SP_DialogYesButton,
-            "SP_DialogNoButton": QStyle.SP_DialogNoButton,
-            "SP_ArrowUp": QStyle.SP_ArrowUp,
-            "SP_ArrowDown": QStyle.SP_ArrowDown,
-            "SP_ArrowLeft": QStyle.SP_ArrowLeft,
-            "SP_ArrowRight": QStyle.SP_ArrowRight,
-            "SP_ArrowBack": QStyle.SP_ArrowBack,
-            "SP_ArrowForward": QStyle.SP_ArrowForward,
-            "SP_DirHomeIcon": QStyle.SP_DirHomeIcon,
-            "SP_CommandLink": QStyle.SP_CommandLink,
-            "SP_VistaShield": QStyle.SP_VistaShield,
-            "SP_BrowserReload": QStyle.SP_BrowserReload,
-            "SP_BrowserStop": QStyle.SP_BrowserStop,
-            "SP_MediaPlay": QStyle.SP_MediaPlay,
-            "SP_MediaStop": QStyle.SP_MediaStop,
-            "SP_MediaPause": QStyle.SP_MediaPause,
-            "SP_MediaSkipForward": QStyle.SP_MediaSkipForward,
-            "SP_MediaSkipBackward": QStyle.SP_MediaSkipBackward,
-            "SP_MediaSeekForward": QStyle.SP_MediaSeekForward,
-            "SP_MediaSeekBackward": QStyle.SP_MediaSeekBackward,
-            "SP_MediaVolume": QStyle.SP_MediaVolume,
-            "SP_MediaVolumeMuted": QStyle.SP_MediaVolumeMuted,
-            "SP_LineEditClearButton": QStyle.SP_LineEditClearButton,
-            "SP_RestoreDefaultsButton": QStyle.SP_RestoreDefaultsButton,
-        }
+        # Shared constant; callers get their own dict
+        return dict(_QT_STANDARD_ICONS)
+    
+    @classmethod
+    def is_qt_standard_icon(cls, name: str) -> bool:
+        """
+        Check whether a name is a Qt standard icon name.
+        
+        Args:
+            name: QStyle.StandardPixmap name (e.g., "SP_DialogSaveButton")
+        
+        Returns:
+            True if the name is listed by list_qt_standard_icons()
+        """
+        return name in _QT_STANDARD_ICON_NAME_SET
 
 
 # ==================== Demo Application ====================
@@ -1786,9 +2308,125 @@ if __name__ == "__main__":
         QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
         QPushButton, QLabel, QComboBox, QListWidget, QListWidgetItem,
         QGroupBox, QGridLayout, QScrollArea, QFrame, QLineEdit,
-        QFileDialog, QSizePolicy
+        QFileDialog, QSizePolicy, QTabWidget
+    )
+    from PySide6.QtGui import QFont, QPixmapCache
+    from string import Template
+    from functools import partial
+    
+    # Color swatch stylesheet, formatted per System Colors entry
+    _SWATCH_QSS = "background-color: {0}; border: 1px solid #666;".format
+    
+    # Semantic color types with their button titles, titled once
+    _SEMANTIC_TITLES = tuple((sem_type, sem_type.title()) for sem_type in _SEMANTIC_TYPES)
+    
+    # Semantic button stylesheet, substituted per semantic type
+    _SEMANTIC_BTN_QSS = Template("""
+        QPushButton {
+            background-color: $bg;
+            color: $fg;
+            border: none;
+            border-radius: 6px;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background-color: $bgh;
+            color: $fgh;
+        }
+    """)
+    
+    def _clear_layout(layout):
+        """Remove and delete every widget in layout, taking items from the end"""
+        for i in range(layout.count() - 1, -1, -1):
+            widget = layout.takeAt(i).widget()
+            if widget:
+                widget.setParent(None)
+                widget.deleteLater()
+    
+    def _swatch_row():
+        """Container widget with a margin-less horizontal layout for preview swatches"""
+        row = QWidget()
+        QHBoxLayout(row).setContentsMargins(0, 0, 0, 0)
+        return row
+    
+    def _swatch_pool(row, prefix, count, width, height):
+        """Add count hidden, fixed-size swatch labels named prefix0.. and a trailing stretch to row"""
+        layout = row.layout()
+        swatches = []
+        for i in range(count):
+            swatch = QLabel()
+            swatch.setObjectName(f"{prefix}{i}")
+            swatch.setFixedSize(width, height)
+            swatch.setAlignment(Qt.AlignCenter)
+            swatch.hide()
+            layout.addWidget(swatch)
+            swatches.append(swatch)
+        layout.addStretch()
+        return swatches
+    
+    def _icon_pixmap_48(icon):
+        """Get icon rasterized at 48x48, shared through QPixmapCache"""
+        # QIcon.cacheKey() is shared by copies and changes when the icon does
+        key = f"ico48:{icon.cacheKey()}"
+        pixmap = QPixmap()
+        if not QPixmapCache.find(key, pixmap):
+            pixmap = icon.pixmap(48, 48)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+    
+    def _std_pixmap(sp, size):
+        """Get a Qt standard icon rasterized at size, shared through QPixmapCache"""
+        key = f"sp:{QApplication.style().name()}:{sp.value}@{size}"
+        pixmap = QPixmap()
+        if QPixmapCache.find(key, pixmap):
+            return pixmap
+        icon = IconTheme.get_standard_icon(sp)
+        if icon.isNull():
+            return None
+        pixmap = icon.pixmap(size, size)
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+    
+    # Hex digits and the digit counts QColor accepts after "#", for test_contrast()
+    _HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+    _HEX_LENGTHS = frozenset((3, 6, 8, 9, 12))
+    
+    # KDE preview swatches as (label, background key, foreground key), and
+    # semantic swatches as (label, key, fallback color)
+    _KDE_SWATCH_PAIRS = (
+        ("Window", "window_bg", "window_fg"),
+        ("View", "view_bg", "view_fg"),
+        ("Button", "button_bg", "button_fg"),
+        ("Selection", "selection_bg", "selection_fg"),
+    )
+    _KDE_SEMANTIC_SWATCHES = (
+        ("Positive", "positive", "#28a745"),
+        ("Negative", "negative", "#dc3545"),
+        ("Neutral", "neutral", "#ffc107"),
+        ("Link", "link", "#17a2b8"),
     )
-    from PySide6.QtGui import QFont
+    
+    # KDE preview frame and its swatches, styled by one sheet on the frame; the
+    # frame rule keeps the unselected-sheet behavior of reaching every child
+    _KDE_FRAME_QSS = (
+        "* {{ background: {0}; border-radius: 8px; padding: 10px; }}\n"
+        "#kdePreviewInfo {{ font-weight: bold;{1} }}\n"
+    ).format
+    _KDE_SWATCH_QSS = (
+        "#{0} {{ background-color: {1}; color: {2}; border-radius: 4px;"
+        " font-size: 11px; font-weight: bold; }}\n"
+    ).format
+    _KDE_SEMANTIC_QSS = (
+        "#{0} {{ background-color: {1}; color: {2}; border-radius: 4px; font-size: 10px; }}\n"
+    ).format
+    
+    # Contrast result frame and its labels, styled by one sheet on the frame
+    _CONTRAST_QSS = Template("""
+        QFrame#contrastResult { background: $bg; border-radius: 8px; }
+        QLabel { background: transparent; color: $fg; }
+        QLabel#contrastSample { font-size: 16px; font-weight: bold; }
+        QLabel#contrastInfo { font-size: 11px; }
+    """)
     
     class DemoWindow(QMainWindow):
         def __init__(self):
@@ -1796,32 +2434,71 @@ if __name__ == "__main__":
             self.setWindowTitle("Look and Feel Utilities Demo")
             self.resize(1000, 800)
             
-            # Sample icons list for the grid
-            self.sample_icons = [
+            # Sample icons list for the grid (interned, they key self.icon_labels)
+            self.sample_icons = [sys.intern(name) for name in (
                 "document-new", "document-save", "edit-copy", "edit-paste",
                 "folder", "folder-open", "go-home", "go-previous", "go-next",
                 "dialog-information", "dialog-warning", "dialog-error",
                 "application-exit", "help-about", "system-search",
                 "media-playback-start", "media-playback-pause", "media-playback-stop",
-            ]
+            )]
             
             # Store icon labels for refresh
             self.icon_labels = {}
             
-            # Main widget with scroll
-            scroll = QScrollArea()
-            scroll.setWidgetResizable(True)
-            self.setCentralWidget(scroll)
+            # Rasterized sample icons by (theme, name, size); None if not found
+            self._pixmap_cache = {}
+            
+            # Icon lookup results by (theme, name) as (icon, path, has_icon)
+            self._lookup_cache = {}
+            
+            # Last applied scheme, style and icon theme, to skip redundant re-applies
+            self._applied_scheme = None
+            self._applied_style = None
+            self._applied_theme = None
+            # Last KDE scheme shown in the preview, to skip repeated signals
+            self._last_previewed_scheme = None
             
-            main_widget = QWidget()
-            scroll.setWidget(main_widget)
-            layout = QVBoxLayout(main_widget)
+            # Sections are grouped into tabs whose pages are built on first view
+            central = QWidget()
+            self.setCentralWidget(central)
+            layout = QVBoxLayout(central)
             
             # Title
             title = QLabel("Look and Feel Utilities Demo")
             title.setStyleSheet("font-size: 24px; font-weight: bold; margin: 20px;")
             layout.addWidget(title)
             
+            self.tabs = QTabWidget()
+            layout.addWidget(self.tabs)
+            
+            # Page builders by tab index, dropped once the page exists
+            self._page_builders = {}
+            for label, builder in (
+                ("Appearance", self._build_appearance_page),
+                ("Colors", self._build_colors_page),
+                ("Icons", self._build_icons_page),
+            ):
+                scroll = QScrollArea()
+                scroll.setWidgetResizable(True)
+                self._page_builders[self.tabs.addTab(scroll, label)] = builder
+            
+            self.tabs.currentChanged.connect(self._ensure_page)
+            self._ensure_page(self.tabs.currentIndex())
+        
+        def _ensure_page(self, index):
+            """Build the page at index on its first activation"""
+            builder = self._page_builders.pop(index, None)
+            if builder is None:
+                return
+            page = QWidget()
+            layout = QVBoxLayout(page)
+            builder(layout)
+            layout.addStretch()
+            self.tabs.widget(index).setWidget(page)
+        
+        def _build_appearance_page(self, layout):
+            """Color scheme, Qt style and KDE color scheme sections"""
             # Color Scheme Section
             scheme_group = QGroupBox("Color Scheme")
             scheme_layout = QVBoxLayout(scheme_group)
@@ -1832,15 +2509,21 @@ if __name__ == "__main__":
             scheme_btns.addWidget(self.scheme_label)
             
             btn_dark = QPushButton("Force Dark Mode")
-            btn_dark.clicked.connect(self.force_dark)
+            btn_dark.clicked.connect(
+                partial(self._apply_scheme, ColorScheme.DARK, LookAndFeel.force_dark_mode)
+            )
             scheme_btns.addWidget(btn_dark)
             
             btn_light = QPushButton("Force Light Mode")
-            btn_light.clicked.connect(self.force_light)
+            btn_light.clicked.connect(
+                partial(self._apply_scheme, ColorScheme.LIGHT, LookAndFeel.force_light_mode)
+            )
             scheme_btns.addWidget(btn_light)
             
             btn_reset = QPushButton("Reset to System")
-            btn_reset.clicked.connect(self.reset_scheme)
+            btn_reset.clicked.connect(
+                partial(self._apply_scheme, ColorScheme.SYSTEM, LookAndFeel.reset_color_scheme)
+            )
             scheme_btns.addWidget(btn_reset)
             
             scheme_layout.addLayout(scheme_btns)
@@ -1903,21 +2586,29 @@ if __name__ == "__main__":
             # Scheme preview
             self.kde_preview_frame = QFrame()
             self.kde_preview_frame.setMinimumHeight(100)
-            self.kde_preview_frame.setStyleSheet("background: #f0f0f0; border-radius: 8px; padding: 10px;")
+            # Frame and info label rules, kept when a scheme has no window background
+            self._kde_frame_qss = _KDE_FRAME_QSS("#f0f0f0", "")
+            self.kde_preview_frame.setStyleSheet(self._kde_frame_qss)
             
             kde_preview_layout = QVBoxLayout(self.kde_preview_frame)
             
             self.kde_preview_info = QLabel("Select a scheme to preview")
-            self.kde_preview_info.setStyleSheet("font-weight: bold;")
+            self.kde_preview_info.setObjectName("kdePreviewInfo")
             kde_preview_layout.addWidget(self.kde_preview_info)
             
             # Color swatches row
-            self.kde_swatches_layout = QHBoxLayout()
-            kde_preview_layout.addLayout(self.kde_swatches_layout)
+            self.kde_swatches_row = _swatch_row()
+            self._color_swatches = _swatch_pool(
+                self.kde_swatches_row, "kdeSwatch", len(_KDE_SWATCH_PAIRS), 80, 40
+            )
+            kde_preview_layout.addWidget(self.kde_swatches_row)
             
             # Semantic colors from scheme
-            self.kde_semantic_layout = QHBoxLayout()
-            kde_preview_layout.addLayout(self.kde_semantic_layout)
+            self.kde_semantic_row = _swatch_row()
+            self._semantic_swatches = _swatch_pool(
+                self.kde_semantic_row, "kdeSemantic", len(_KDE_SEMANTIC_SWATCHES), 70, 30
+            )
+            kde_preview_layout.addWidget(self.kde_semantic_row)
             
             kde_layout.addWidget(self.kde_preview_frame)
             
@@ -1940,29 +2631,25 @@ if __name__ == "__main__":
             kde_layout.addLayout(kde_path_row)
             
             layout.addWidget(kde_group)
-            
+        
+        def _build_colors_page(self, layout):
+            """System colors, semantic colors and contrast sections"""
             # System Colors Section
             colors_group = QGroupBox("System Colors")
             colors_layout = QGridLayout(colors_group)
             
             colors = LookAndFeel.get_system_colors()
-            row = 0
-            col = 0
-            for name, hex_color in colors.items():
+            for i, (name, hex_color) in enumerate(colors.items()):
+                row, col = divmod(i, 3)
                 color_frame = QFrame()
                 color_frame.setFixedSize(30, 30)
-                color_frame.setStyleSheet(f"background-color: {hex_color}; border: 1px solid #666;")
+                color_frame.setStyleSheet(_SWATCH_QSS(hex_color))
                 
                 label = QLabel(f"{name}: {hex_color}")
                 label.setStyleSheet("font-size: 11px;")
                 
                 colors_layout.addWidget(color_frame, row, col * 2)
                 colors_layout.addWidget(label, row, col * 2 + 1)
-                
-                col += 1
-                if col >= 3:
-                    col = 0
-                    row += 1
             
             layout.addWidget(colors_group)
             
@@ -1972,29 +2659,21 @@ if __name__ == "__main__":
             
             semantic_colors = LookAndFeel.get_semantic_colors()
             
-            # Show semantic buttons with proper text colors
-            semantic_types = ["success", "warning", "error", "info", "critical", "neutral"]
+            # Show semantic buttons with proper text colors, resolving each
+            # type's base and hover colors once
+            button_colors = [
+                (title, semantic_colors[sem_type], semantic_colors[f"{sem_type}_text"],
+                 semantic_colors[f"{sem_type}_light"], semantic_colors[f"{sem_type}_light_text"])
+                for sem_type, title in _SEMANTIC_TITLES
+            ]
             
             buttons_row = QHBoxLayout()
-            for sem_type in semantic_types:
-                bg_color = semantic_colors[sem_type]
-                text_color = semantic_colors[f"{sem_type}_text"]
-                
-                btn = QPushButton(f"{sem_type.title()}\n{bg_color}")
+            for title, bg_color, text_color, hover_color, hover_text_color in button_colors:
+                btn = QPushButton(f"{title}\n{bg_color}")
                 btn.setFixedSize(100, 60)
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {bg_color};
-                        color: {text_color};
-                        border: none;
-                        border-radius: 6px;
-                        font-weight: bold;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {semantic_colors[f'{sem_type}_light']};
-                        color: {semantic_colors[f'{sem_type}_light_text']};
-                    }}
-                """)
+                btn.setStyleSheet(_SEMANTIC_BTN_QSS.substitute(
+                    bg=bg_color, fg=text_color, bgh=hover_color, fgh=hover_text_color
+                ))
                 buttons_row.addWidget(btn)
             
             buttons_row.addStretch()
@@ -2006,15 +2685,12 @@ if __name__ == "__main__":
             semantic_layout.addWidget(variants_label)
             
             variants_grid = QGridLayout()
-            row = 0
-            for sem_type in semantic_types:
-                col = 0
-                for variant in ["", "_light", "_dark"]:
+            for row, sem_type in enumerate(_SEMANTIC_TYPES):
+                for col, variant in enumerate(("", "_light", "_dark")):
                     bg_key = f"{sem_type}{variant}"
-                    text_key = f"{sem_type}{variant}_text"
                     
                     bg_color = semantic_colors[bg_key]
-                    text_color = semantic_colors[text_key]
+                    text_color = semantic_colors[f"{bg_key}_text"]
                     
                     label = QLabel(f" {bg_key} ")
                     label.setAlignment(Qt.AlignCenter)
@@ -2026,8 +2702,6 @@ if __name__ == "__main__":
                         font-size: 10px;
                     """)
                     variants_grid.addWidget(label, row, col)
-                    col += 1
-                row += 1
             
             semantic_layout.addLayout(variants_grid)
             layout.addWidget(semantic_group)
@@ -2043,6 +2717,10 @@ if __name__ == "__main__":
             self.contrast_input.setPlaceholderText("#28a745 or any hex color")
             self.contrast_input.setText("#28a745")
             self.contrast_input.returnPressed.connect(self.test_contrast)
+            # Retest while typing, once the input has been idle for 100 ms
+            self._contrast_timer = QTimer(self, singleShot=True, interval=100)
+            self._contrast_timer.timeout.connect(self.test_contrast)
+            self.contrast_input.textChanged.connect(lambda: self._contrast_timer.start())
             contrast_input_row.addWidget(self.contrast_input)
             
             btn_test_contrast = QPushButton("Get Contrasting Text Color")
@@ -2054,20 +2732,24 @@ if __name__ == "__main__":
             
             # Result display
             self.contrast_result_frame = QFrame()
+            self.contrast_result_frame.setObjectName("contrastResult")
             self.contrast_result_frame.setFixedHeight(80)
-            self.contrast_result_frame.setStyleSheet("background: #28a745; border-radius: 8px;")
             
             result_layout = QVBoxLayout(self.contrast_result_frame)
             self.contrast_result_label = QLabel("Sample Text on This Background")
+            self.contrast_result_label.setObjectName("contrastSample")
             self.contrast_result_label.setAlignment(Qt.AlignCenter)
-            self.contrast_result_label.setStyleSheet("color: #ffffff; font-size: 16px; font-weight: bold;")
             result_layout.addWidget(self.contrast_result_label)
             
             self.contrast_info_label = QLabel("Text color: #ffffff | Contrast ratio: 4.57:1 | WCAG AA: ✓")
+            self.contrast_info_label.setObjectName("contrastInfo")
             self.contrast_info_label.setAlignment(Qt.AlignCenter)
-            self.contrast_info_label.setStyleSheet("color: #ffffff; font-size: 11px;")
             result_layout.addWidget(self.contrast_info_label)
             
+            # (background, text) colors currently shown by the result frame
+            self._contrast_colors = None
+            self._set_contrast_colors("#28a745", "#ffffff")
+            
             contrast_layout.addWidget(self.contrast_result_frame)
             
             # Tinted option
@@ -2081,7 +2763,9 @@ if __name__ == "__main__":
             contrast_layout.addLayout(tint_row)
             
             layout.addWidget(contrast_group)
-            
+        
+        def _build_icons_page(self, layout):
+            """Icon theme, icon lookup, sample icon and Qt standard icon sections"""
             # Icon Themes Section
             icon_theme_group = QGroupBox("Icon Themes")
             icon_theme_layout = QVBoxLayout(icon_theme_group)
@@ -2127,9 +2811,12 @@ if __name__ == "__main__":
             icon_theme_layout.addLayout(path_row)
             
             # Current search paths
-            self.paths_label = QLabel(f"Search Paths: {', '.join(IconTheme.get_theme_search_paths()[:3])}...")
+            self.paths_label = QLabel()
             self.paths_label.setStyleSheet("font-size: 10px; color: #666;")
             self.paths_label.setWordWrap(True)
+            # Search paths the label was last formatted from
+            self._shown_paths = None
+            self._update_paths_label()
             icon_theme_layout.addWidget(self.paths_label)
             
             layout.addWidget(icon_theme_group)
@@ -2144,6 +2831,10 @@ if __name__ == "__main__":
             self.icon_name_input = QLineEdit()
             self.icon_name_input.setPlaceholderText("e.g., document-save, folder, edit-copy")
             self.icon_name_input.returnPressed.connect(self.lookup_icon)
+            # Look up while typing, once the input has been idle for 100 ms
+            self._lookup_timer = QTimer(self, singleShot=True, interval=100)
+            self._lookup_timer.timeout.connect(self.lookup_icon)
+            self.icon_name_input.textChanged.connect(lambda: self._lookup_timer.start())
             lookup_row.addWidget(self.icon_name_input)
             
             btn_lookup = QPushButton("Get Icon")
@@ -2197,14 +2888,13 @@ if __name__ == "__main__":
                 ("SP_MediaPlay", QStyle.SP_MediaPlay),
             ]
             
-            row = 0
-            col = 0
-            for name, sp in qt_sample_icons:
-                icon = IconTheme.get_standard_icon(sp)
+            for i, (name, sp) in enumerate(qt_sample_icons):
+                row, col = divmod(i, 3)
+                pixmap = _std_pixmap(sp, 24)
                 
                 icon_label = QLabel()
-                if not icon.isNull():
-                    icon_label.setPixmap(icon.pixmap(24, 24))
+                if pixmap is not None:
+                    icon_label.setPixmap(pixmap)
                 else:
                     icon_label.setText("?")
                 icon_label.setFixedSize(24, 24)
@@ -2214,34 +2904,24 @@ if __name__ == "__main__":
                 
                 qt_icons_layout.addWidget(icon_label, row, col * 2)
                 qt_icons_layout.addWidget(name_label, row, col * 2 + 1)
-                
-                col += 1
-                if col >= 3:
-                    col = 0
-                    row += 1
             
             layout.addWidget(qt_icons_group)
-            
-            layout.addStretch()
         
         def _populate_icons_grid(self):
             """Populate the sample icons grid"""
             # Clear existing widgets
-            while self.icons_layout.count():
-                item = self.icons_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
+            _clear_layout(self.icons_layout)
             
             self.icon_labels.clear()
             
-            row = 0
-            col = 0
-            for icon_name in self.sample_icons:
-                icon = IconTheme.get_icon(icon_name)
+            theme = IconTheme.get_current_theme()
+            for i, icon_name in enumerate(self.sample_icons):
+                row, col = divmod(i, 4)
+                pixmap = self._icon_pixmap(icon_name, theme=theme)
                 
                 icon_label = QLabel()
-                if not icon.isNull():
-                    icon_label.setPixmap(icon.pixmap(24, 24))
+                if pixmap is not None:
+                    icon_label.setPixmap(pixmap)
                 else:
                     icon_label.setText("?")
                     icon_label.setStyleSheet("color: #999;")
@@ -2255,18 +2935,25 @@ if __name__ == "__main__":
                 
                 self.icons_layout.addWidget(icon_label, row, col * 2)
                 self.icons_layout.addWidget(name_label, row, col * 2 + 1)
-                
-                col += 1
-                if col >= 4:
-                    col = 0
-                    row += 1
+        
+        def _icon_pixmap(self, icon_name, size=24, theme=None):
+            """Get a sample icon rasterized at size, reusing earlier results per theme"""
+            if theme is None:
+                theme = IconTheme.get_current_theme()
+            key = (theme, icon_name, size)
+            if key not in self._pixmap_cache:
+                icon = IconTheme.get_icon(icon_name)
+                self._pixmap_cache[key] = None if icon.isNull() else icon.pixmap(size, size)
+            return self._pixmap_cache[key]
         
         def _refresh_icons_grid(self):
             """Refresh icons in the grid with current theme"""
+            # Resolved once for the whole refresh
+            theme = IconTheme.get_current_theme()
             for icon_name, icon_label in self.icon_labels.items():
-                icon = IconTheme.get_icon(icon_name)
-                if not icon.isNull():
-                    icon_label.setPixmap(icon.pixmap(24, 24))
+                pixmap = self._icon_pixmap(icon_name, theme=theme)
+                if pixmap is not None:
+                    icon_label.setPixmap(pixmap)
                     icon_label.setText("")
                     icon_label.setStyleSheet("")
                 else:
@@ -2275,34 +2962,46 @@ if __name__ == "__main__":
                     icon_label.setStyleSheet("color: #999;")
             
             # Update group title
-            self.icons_group.setTitle(f"Sample Icons (from {IconTheme.get_current_theme()})")
+            self.icons_group.setTitle(f"Sample Icons (from {theme})")
         
-        def force_dark(self):
-            LookAndFeel.force_dark_mode()
-            self.scheme_label.setText(f"Current: {LookAndFeel.get_color_scheme().value}")
+        def _show_scheme(self, scheme=None):
+            """Show scheme in the scheme label; None resolves the current one"""
+            if scheme is None:
+                scheme = LookAndFeel.get_color_scheme()
+            self.scheme_label.setText(f"Current: {scheme.value}")
         
-        def force_light(self):
-            LookAndFeel.force_light_mode()
-            self.scheme_label.setText(f"Current: {LookAndFeel.get_color_scheme().value}")
-        
-        def reset_scheme(self):
-            LookAndFeel.reset_color_scheme()
-            self.scheme_label.setText(f"Current: {LookAndFeel.get_color_scheme().value}")
+        def _apply_scheme(self, scheme, apply):
+            """Run one of the LookAndFeel scheme calls unless scheme is already applied"""
+            if self._applied_scheme is scheme:
+                return
+            apply()
+            self._applied_scheme = scheme
+            # A forced scheme is known; the system one depends on the palette
+            self._show_scheme(None if scheme is ColorScheme.SYSTEM else scheme)
         
         def apply_style(self):
             style_name = self.style_combo.currentText()
-            LookAndFeel.set_style(style_name)
+            if style_name == self._applied_style:
+                return
+            if LookAndFeel.set_style(style_name):
+                self._applied_style = style_name
         
         def apply_icon_theme(self):
             """Apply selected icon theme and refresh the icons grid"""
             theme_name = self.theme_combo.currentText()
+            if theme_name == self._applied_theme:
+                return
             if theme_name and theme_name != "(no themes found)":
                 IconTheme.set_theme(theme_name)
                 self.theme_label.setText(f"Current Theme: {theme_name}")
                 self._refresh_icons_grid()
+                self._applied_theme = theme_name
         
         def refresh_theme_list(self):
             """Refresh the list of available themes"""
+            # Lookups and sample icons may resolve differently against the refreshed themes
+            self._lookup_cache.clear()
+            self._pixmap_cache.clear()
             self.theme_combo.clear()
             themes = IconTheme.list_icon_themes()
             self.theme_combo.addItems(themes if themes else ["(no themes found)"])
@@ -2322,10 +3021,19 @@ if __name__ == "__main__":
             path = self.theme_path_input.text().strip()
             if path:
                 IconTheme.add_theme_search_path(path)
+                # The same theme name may now resolve to other files
+                self._applied_theme = None
                 self.theme_path_input.clear()
                 self.refresh_theme_list()
-                paths = IconTheme.get_theme_search_paths()
-                self.paths_label.setText(f"Search Paths: {', '.join(paths[:3])}{'...' if len(paths) > 3 else ''}")
+                self._update_paths_label()
+        
+        def _update_paths_label(self):
+            """Show the first search paths, reformatting only when the list changed"""
+            paths = IconTheme.get_theme_search_paths()
+            if paths == self._shown_paths:
+                return
+            self._shown_paths = paths
+            self.paths_label.setText(f"Search Paths: {', '.join(paths[:3])}{'...' if len(paths) > 3 else ''}")
         
         def lookup_icon(self):
             """Look up an icon by name"""
@@ -2334,12 +3042,10 @@ if __name__ == "__main__":
                 self.lookup_result_label.setText("Please enter an icon name")
                 return
             
-            icon = IconTheme.get_icon(icon_name)
-            icon_path = IconTheme.get_icon_path(icon_name)
-            has_icon = IconTheme.has_icon(icon_name)
+            icon, icon_path, has_icon = self._resolve_icon(icon_name)
             
             if not icon.isNull():
-                self.lookup_icon_label.setPixmap(icon.pixmap(48, 48))
+                self.lookup_icon_label.setPixmap(_icon_pixmap_48(icon))
                 self.lookup_icon_label.setText("")
                 
                 if icon_path:
@@ -2363,6 +3069,18 @@ if __name__ == "__main__":
                     f"Has theme icon: {has_icon}"
                 )
         
+        def _resolve_icon(self, icon_name):
+            """Get (icon, path, has theme icon) for a name in the current theme, reusing earlier lookups"""
+            key = (IconTheme.get_current_theme(), icon_name)
+            result = self._lookup_cache.get(key)
+            if result is None:
+                result = self._lookup_cache[key] = (
+                    IconTheme.get_icon(icon_name),
+                    IconTheme.get_icon_path(icon_name),
+                    IconTheme.has_icon(icon_name),
+                )
+            return result
+        
         def test_contrast(self, tinted: bool = False):
             """Test contrast color for a given background"""
             bg_color = self.contrast_input.text().strip()
@@ -2374,9 +3092,9 @@ if __name__ == "__main__":
                 bg_color = f"#{bg_color}"
             
             try:
-                # Validate color
-                qcolor = QColor(bg_color)
-                if not qcolor.isValid():
+                # Validate color, checking the length before the digits
+                digits = bg_color[1:]
+                if len(digits) not in _HEX_LENGTHS or not _HEX_DIGITS.issuperset(digits):
                     self.contrast_info_label.setText("Invalid color! Use hex format like #28a745")
                     return
                 
@@ -2389,9 +3107,7 @@ if __name__ == "__main__":
                 wcag_aaa = "✓" if contrast_ratio >= 7.0 else "✗"
                 
                 # Update display
-                self.contrast_result_frame.setStyleSheet(f"background: {bg_color}; border-radius: 8px;")
-                self.contrast_result_label.setStyleSheet(f"color: {text_color}; font-size: 16px; font-weight: bold;")
-                self.contrast_info_label.setStyleSheet(f"color: {text_color}; font-size: 11px;")
+                self._set_contrast_colors(bg_color, text_color)
                 
                 mode = "tinted" if tinted else "standard"
                 self.contrast_info_label.setText(
@@ -2402,6 +3118,15 @@ if __name__ == "__main__":
             except Exception as e:
                 self.contrast_info_label.setText(f"Error: {str(e)}")
         
+        def _set_contrast_colors(self, bg_color, text_color):
+            """Restyle the contrast result frame, skipping unchanged colors"""
+            if self._contrast_colors == (bg_color, text_color):
+                return
+            self._contrast_colors = (bg_color, text_color)
+            self.contrast_result_frame.setStyleSheet(
+                _CONTRAST_QSS.substitute(bg=bg_color, fg=text_color)
+            )
+        
         def test_contrast_tinted(self):
             """Test tinted contrast color"""
             self.test_contrast(tinted=True)
@@ -2410,6 +3135,8 @@ if __name__ == "__main__":
             """Preview a KDE color scheme"""
             if not scheme_name or scheme_name == "(no KDE schemes found)":
                 return
+            if scheme_name == self._last_previewed_scheme:
+                return
             
             info = KDEColorScheme.get_scheme_info(scheme_name)
             if not info:
@@ -2421,100 +3148,70 @@ if __name__ == "__main__":
             display_name = info.get("display_name", scheme_name)
             self.kde_preview_info.setText(f"{display_name} ({is_dark} scheme)")
             
-            # Clear previous swatches
-            while self.kde_swatches_layout.count():
-                item = self.kde_swatches_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-            
-            while self.kde_semantic_layout.count():
-                item = self.kde_semantic_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-            
             preview = info.get("preview", {})
             
-            # Create color swatches
-            swatch_pairs = [
-                ("Window", "window_bg", "window_fg"),
-                ("View", "view_bg", "view_fg"),
-                ("Button", "button_bg", "button_fg"),
-                ("Selection", "selection_bg", "selection_fg"),
-            ]
+            # Fill color swatches from the pool, in order
+            # Swatch background hex by preview key, reused for the frame below
+            swatch_hex = {}
+            # Swatch rules, set on the frame in one stylesheet at the end
+            swatch_qss = []
             
-            for label, bg_key, fg_key in swatch_pairs:
+            swatches = iter(self._color_swatches)
+            for label, bg_key, fg_key in _KDE_SWATCH_PAIRS:
                 bg_str = preview.get(bg_key)
                 fg_str = preview.get(fg_key)
                 
                 if bg_str:
-                    bg_color = KDEColorScheme._parse_color(bg_str)
-                    fg_color = KDEColorScheme._parse_color(fg_str) if fg_str else None
+                    bg_hex = KDEColorScheme._parse_color_hex(bg_str)
+                    fg_hex = KDEColorScheme._parse_color_hex(fg_str) if fg_str else None
                     
-                    if bg_color:
-                        swatch = QLabel(label)
-                        swatch.setFixedSize(80, 40)
-                        swatch.setAlignment(Qt.AlignCenter)
+                    if bg_hex:
+                        swatch = next(swatches)
+                        swatch.setText(label)
                         
-                        fg_hex = fg_color.name() if fg_color else LookAndFeel.get_contrasting_color(bg_color)
-                        swatch.setStyleSheet(f"""
-                            background-color: {bg_color.name()};
-                            color: {fg_hex};
-                            border-radius: 4px;
-                            font-size: 11px;
-                            font-weight: bold;
-                        """)
-                        self.kde_swatches_layout.addWidget(swatch)
-            
-            self.kde_swatches_layout.addStretch()
-            
-            # Create semantic color swatches
-            semantic_map = [
-                ("Positive", "positive", "#28a745"),
-                ("Negative", "negative", "#dc3545"),
-                ("Neutral", "neutral", "#ffc107"),
-                ("Link", "link", "#17a2b8"),
-            ]
-            
-            for label, key, fallback in semantic_map:
+                        swatch_hex[bg_key] = bg_hex
+                        if not fg_hex:
+                            fg_hex = LookAndFeel.get_contrasting_color(bg_hex)
+                        swatch_qss.append(_KDE_SWATCH_QSS(swatch.objectName(), bg_hex, fg_hex))
+                        swatch.show()
+            
+            # Hide the slots this scheme does not fill
+            for swatch in swatches:
+                swatch.hide()
+            
+            # Fill semantic color swatches from the pool, in order
+            swatches = iter(self._semantic_swatches)
+            for label, key, fallback in _KDE_SEMANTIC_SWATCHES:
                 color_str = preview.get(key)
                 if color_str:
-                    color = KDEColorScheme._parse_color(color_str)
-                    if color:
-                        swatch = QLabel(label)
-                        swatch.setFixedSize(70, 30)
-                        swatch.setAlignment(Qt.AlignCenter)
+                    color_hex = KDEColorScheme._parse_color_hex(color_str)
+                    if color_hex:
+                        swatch = next(swatches)
+                        swatch.setText(label)
                         
-                        text_color = LookAndFeel.get_contrasting_color(color)
-                        swatch.setStyleSheet(f"""
-                            background-color: {color.name()};
-                            color: {text_color};
-                            border-radius: 4px;
-                            font-size: 10px;
-                        """)
-                        self.kde_semantic_layout.addWidget(swatch)
+                        text_color = LookAndFeel.get_contrasting_color(color_hex)
+                        swatch_qss.append(_KDE_SEMANTIC_QSS(swatch.objectName(), color_hex, text_color))
+                        swatch.show()
             
-            self.kde_semantic_layout.addStretch()
+            for swatch in swatches:
+                swatch.hide()
             
             # Update preview frame background based on scheme
-            window_bg = preview.get("window_bg")
-            if window_bg:
-                bg_color = KDEColorScheme._parse_color(window_bg)
-                if bg_color:
-                    fg_color = LookAndFeel.get_contrasting_color(bg_color)
-                    self.kde_preview_frame.setStyleSheet(f"""
-                        background: {bg_color.name()};
-                        border-radius: 8px;
-                        padding: 10px;
-                    """)
-                    self.kde_preview_info.setStyleSheet(f"font-weight: bold; color: {fg_color};")
+            bg_hex = swatch_hex.get("window_bg")
+            if bg_hex:
+                fg_color = LookAndFeel.get_contrasting_color(bg_hex)
+                self._kde_frame_qss = _KDE_FRAME_QSS(bg_hex, f" color: {fg_color};")
+            self.kde_preview_frame.setStyleSheet(self._kde_frame_qss + "".join(swatch_qss))
+            self._last_previewed_scheme = scheme_name
         
         def apply_kde_scheme(self):
             """Apply the selected KDE color scheme"""
             scheme_name = self.kde_scheme_combo.currentText()
             if scheme_name and scheme_name != "(no KDE schemes found)":
                 if KDEColorScheme.apply_scheme(scheme_name):
+                    self._applied_scheme = None
                     self.kde_scheme_label.setText(f"Current KDE Scheme: {scheme_name}")
-                    self.scheme_label.setText(f"Current: {LookAndFeel.get_color_scheme().value}")
+                    self._show_scheme()
                     
                     # Refresh semantic colors display
                     self._refresh_semantic_colors()
@@ -2522,8 +3219,9 @@ if __name__ == "__main__":
         def reset_kde_scheme(self):
             """Reset KDE color scheme to system default"""
             KDEColorScheme.reset_scheme()
+            self._applied_scheme = None
             self.kde_scheme_label.setText("Current KDE Scheme: (none)")
-            self.scheme_label.setText(f"Current: {LookAndFeel.get_color_scheme().value}")
+            self._show_scheme()
             self._refresh_semantic_colors()
         
         def _refresh_semantic_colors(self):
@@ -2549,12 +3247,18 @@ if __name__ == "__main__":
                 KDEColorScheme.add_scheme_search_path(path)
                 self.kde_path_input.clear()
                 
-                # Refresh the combo
+                # Refresh the combo without a preview per intermediate selection,
+                # then preview once; the new path may shadow the previewed scheme
+                self.kde_scheme_combo.blockSignals(True)
                 self.kde_scheme_combo.clear()
                 kde_schemes = KDEColorScheme.list_schemes()
                 self.kde_scheme_combo.addItems(kde_schemes if kde_schemes else ["(no KDE schemes found)"])
+                self.kde_scheme_combo.blockSignals(False)
+                self._last_previewed_scheme = None
+                self.preview_kde_scheme(self.kde_scheme_combo.currentText())
     
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(10240)
     
     font = QFont()
     font.setFamily("Segoe UI")
@@ -2563,5 +3267,5 @@ if __name__ == "__main__":
     
     window = DemoWindow()
     window.show()
-    sys.exit(app.exec())
+    raise SystemExit(app.exec())
 